@@ -1,13 +1,17 @@
 import argparse
 import csv
 import logging
+import os
 import threading
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
-from queue import Queue
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 import boto3
+import botocore.config
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import BotoCoreError, ClientError
 
 # Configure logging
@@ -16,8 +20,60 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Queue for CSV writing
-csv_queue: Queue = Queue()
+# Pending CSV lines: workers extend the deque in batches under one lock and
+# set the event; this avoids queue.Queue's two lock acquisitions plus notify
+# per item on the writer's hot path
+_pending: deque = deque()
+_pending_lock = threading.Lock()
+_wake = threading.Event()
+_writer_done = threading.Event()
+CSV_BATCH_SIZE = 512
+
+
+def enqueue_rows(batch):
+    with _pending_lock:
+        _pending.extend(batch)
+    _wake.set()
+
+# Workers are network-bound, so scale well past core count
+MAX_WORKERS = min(32, (os.cpu_count() or 4) * 8)
+
+CSV_HEADER = [
+    "AccountID",
+    "ResourceCreationDate",
+    "ResourceARN",
+    "ResourceName",
+    "DateOfExtraction",
+    "Type",
+    "Region",
+    "mmsystem",
+    "standard",
+    "product",
+]
+
+
+def csv_line(row) -> bytes:
+    """Serialize one row to a quoted CSV line, ready for os.writev."""
+    return (
+        ",".join('"' + str(col).replace('"', '""') + '"' for col in row) + "\n"
+    ).encode()
+
+# Multipart upload tuning for the consolidated CSV; no-op for files < 8 MB
+S3_TRANSFER_CFG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=20,
+    use_threads=True,
+)
+
+# Shared client config: the default max_pool_connections=10 is exhausted by the
+# ThreadPoolExecutor below, and adaptive retries throttle client-side instead of
+# stampeding the tagging API
+BOTO_CFG = botocore.config.Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
 
 
 def load_accounts_from_csv(csv_file: str) -> Dict[str, List[str]]:
@@ -36,7 +92,7 @@ def load_accounts_from_csv(csv_file: str) -> Dict[str, List[str]]:
 def assume_role(
     role_arn: str, session_name: str = "ResourceTagSession"
 ) -> Tuple[str, str, str]:
-    sts_client = boto3.client("sts")
+    sts_client = boto3.client("sts", config=BOTO_CFG)
     try:
         response = sts_client.assume_role(
             RoleArn=role_arn, RoleSessionName=session_name, DurationSeconds=3600
@@ -52,124 +108,289 @@ def assume_role(
         raise
 
 
+@lru_cache(maxsize=256)
 def get_client(
     service, region, aws_access_key_id, aws_secret_access_key, aws_session_token
 ):
+    # Memoized: building a Session + client parses service models (~tens of ms)
+    # and the same (service, region, creds) triple recurs for every page fetch
     session = boto3.Session(
         aws_access_key_id=aws_access_key_id,
         aws_secret_access_key=aws_secret_access_key,
         aws_session_token=aws_session_token,
     )
-    return session.client(service, region_name=region)
+    return session.client(service, region_name=region, config=BOTO_CFG)
 
 
-def extract_resources(account_id, region, creds):
+def extract_resources(account_id, region, creds, resource_types=None):
     access_key, secret_key, session_token = creds
     try:
         client = get_client(
             "resourcegroupstaggingapi", region, access_key, secret_key, session_token
         )
-        paginator = client.get_paginator("get_resources")
-
-        for page in paginator.paginate(PaginationConfig={"PageSize": 50}):
-            for resource in page.get("ResourceTagMappingList", []):
-                resource_arn = resource.get("ResourceARN", "")
-                tags = {tag["Key"]: tag["Value"] for tag in resource.get("Tags", [])}
-                service_type = resource_arn.split(":")[2] if ":" in resource_arn else ""
-                resource_name = (
-                    resource_arn.split("/")[-1] if "/" in resource_arn else ""
-                )
-                creation_date = ""  # Not available via this API
-                dateofextraction = date.today()
-
-                csv_queue.put(
-                    [
-                        account_id,
-                        creation_date,
-                        resource_arn,
-                        resource_name,
-                        dateofextraction,
-                        service_type,
-                        region,
-                        tags.get("mmsystem", ""),
-                        tags.get("standard", ""),
-                        tags.get("product", ""),
-                    ]
-                )
+        if resource_types and len(resource_types) > 1:
+            # get_resources pagination is serial per token; one sub-query per
+            # type filter lets the categories paginate concurrently
+            with ThreadPoolExecutor(
+                max_workers=min(len(resource_types), 8)
+            ) as sub_executor:
+                sub_futures = [
+                    sub_executor.submit(
+                        _extract_pages, client, account_id, region, [resource_type]
+                    )
+                    for resource_type in resource_types
+                ]
+                for sub_future in as_completed(sub_futures):
+                    sub_future.result()
+        else:
+            _extract_pages(client, account_id, region, resource_types)
         print(f"{account_id} in {region} ✅ completed")
     except Exception as e:
         print(f"❌ Failed for {account_id} in {region}: {e}")
 
 
-def csv_writer(filename):
-    with open(filename, "w", newline="") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(
-            [
-                "AccountID",
-                "ResourceCreationDate",
-                "ResourceARN",
-                "ResourceName",
-                "DateOfExtraction",
-                "Type",
-                "Region",
-                "mmsystem",
-                "standard",
-                "product",
-            ]
+def _page_kwargs(resource_types):
+    # Service-max page size; the manual token loop that consumes these kwargs
+    # skips the paginator's per-page Python overhead
+    kwargs = {"ResourcesPerPage": 100}
+    if resource_types:
+        # Let the tagging API skip services we never report on
+        kwargs["ResourceTypeFilters"] = resource_types
+    return kwargs
+
+
+def _buffer_page(page, account_id, region, local_buf, creation_date, dateofextraction):
+    for resource in page.get("ResourceTagMappingList", []):
+        resource_arn = resource.get("ResourceARN", "")
+        # Single linear scan for the three reported keys instead of
+        # building a full tag dict per resource
+        mmsystem = standard = product = ""
+        for tag in resource.get("Tags", ()):
+            key = tag["Key"]
+            if key == "mmsystem":
+                mmsystem = tag["Value"]
+            elif key == "standard":
+                standard = tag["Value"]
+            elif key == "product":
+                product = tag["Value"]
+        arn_parts = resource_arn.split(":", 3)
+        service_type = arn_parts[2] if len(arn_parts) > 2 else ""
+        resource_name = (
+            resource_arn.rsplit("/", 1)[-1] if "/" in resource_arn else ""
         )
+
+        # Serialize in the worker: the writer thread then only issues
+        # GIL-releasing os.writev calls instead of csv formatting
+        local_buf.append(
+            csv_line(
+                [
+                    account_id,
+                    creation_date,
+                    resource_arn,
+                    resource_name,
+                    dateofextraction,
+                    service_type,
+                    region,
+                    mmsystem,
+                    standard,
+                    product,
+                ]
+            )
+        )
+        if len(local_buf) >= CSV_BATCH_SIZE:
+            enqueue_rows(local_buf)
+            local_buf = []
+    return local_buf
+
+
+def _extract_pages(client, account_id, region, resource_types):
+    local_buf = []
+    kwargs = _page_kwargs(resource_types)
+    creation_date = ""  # Not available via this API
+    dateofextraction = date.today()  # Constant for the run
+    while True:
+        page = client.get_resources(**kwargs)
+        local_buf = _buffer_page(
+            page, account_id, region, local_buf, creation_date, dateofextraction
+        )
+        token = page.get("PaginationToken")
+        if not token:
+            break
+        kwargs["PaginationToken"] = token
+    if local_buf:
+        enqueue_rows(local_buf)
+
+
+def run_async_extraction(account_regions, resource_types=None):
+    """asyncio + aioboto3 path: one event loop replaces the thread pool.
+
+    Useful for very high (account, region) fan-out where per-thread stacks
+    and GIL contention start to dominate. Requires the optional aioboto3
+    dependency.
+    """
+    import asyncio
+
+    import aioboto3
+
+    aio_session = aioboto3.Session()
+
+    async def extract_region(creds, account_id, region):
+        access_key, secret_key, session_token = creds
+        try:
+            async with aio_session.client(
+                "resourcegroupstaggingapi",
+                region_name=region,
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                aws_session_token=session_token,
+                config=BOTO_CFG,
+            ) as client:
+                local_buf = []
+                kwargs = _page_kwargs(resource_types)
+                creation_date = ""
+                dateofextraction = date.today()
+                while True:
+                    page = await client.get_resources(**kwargs)
+                    local_buf = _buffer_page(
+                        page, account_id, region, local_buf,
+                        creation_date, dateofextraction,
+                    )
+                    token = page.get("PaginationToken")
+                    if not token:
+                        break
+                    kwargs["PaginationToken"] = token
+                if local_buf:
+                    enqueue_rows(local_buf)
+            print(f"{account_id} in {region} ✅ completed")
+        except Exception as e:
+            print(f"❌ Failed for {account_id} in {region}: {e}")
+
+    async def extract_account(account_id, regions):
+        role_arn = f"arn:aws:iam::{account_id}:role/tag-check-assume-role"
+        try:
+            creds = await asyncio.to_thread(
+                assume_role, role_arn, f"GitHubTagCheck-{account_id}"
+            )
+        except Exception as e:
+            logger.error(f"Skipping account {account_id}: failed to assume role: {e}")
+            return
+        await asyncio.gather(
+            *(extract_region(creds, account_id, region) for region in regions)
+        )
+
+    async def run():
+        await asyncio.gather(
+            *(
+                extract_account(account_id, regions)
+                for account_id, regions in account_regions.items()
+            )
+        )
+
+    asyncio.run(run())
+
+
+def csv_writer(filename):
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, csv_line(CSV_HEADER))
         while True:
-            row = csv_queue.get()
-            if row == "DONE":
+            _wake.wait(0.1)
+            _wake.clear()
+            with _pending_lock:
+                batch = list(_pending)
+                _pending.clear()
+            if batch:
+                # Vectored writes outside the lock; IOV_MAX caps one writev
+                for i in range(0, len(batch), 1024):
+                    os.writev(fd, batch[i : i + 1024])
+            elif _writer_done.is_set():
                 break
-            writer.writerow(row)
-            csv_queue.task_done()
+    finally:
+        os.close(fd)
 
 
 def upload_to_s3(filename: str, bucket: str, prefix: str = ""):
-    s3_client = boto3.client("s3")
+    s3_client = boto3.client("s3", config=BOTO_CFG)
     key = f"{prefix.rstrip('/')}/{filename}" if prefix else filename
 
     try:
-        s3_client.upload_file(filename, bucket, key)
+        s3_client.upload_file(filename, bucket, key, Config=S3_TRANSFER_CFG)
         print(f"✅ File uploaded to S3: s3://{bucket}/{key}")
     except Exception as e:
         print(f"❌ Failed to upload to S3: {e}")
 
 
-def main(csv_path, s3_bucket=None, s3_prefix=""):
+def main(csv_path, s3_bucket=None, s3_prefix="", resource_types=None, use_async=False):
     account_regions = load_accounts_from_csv(csv_path)
 
     # Output file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"AllAccounts_TF_Modules_Adoption_Report_{timestamp}.csv"
 
+    if use_async:
+        # Probe the optional dependency before the non-daemon writer thread
+        # exists: an ImportError raised after start would leave the writer
+        # spinning forever and the process hanging instead of exiting
+        try:
+            import aioboto3  # noqa: F401
+        except ImportError:
+            print("⚠️ aioboto3 not installed; falling back to the thread pool")
+            use_async = False
+
     # Start CSV writer thread
     writer_thread = threading.Thread(target=csv_writer, args=(filename,))
     writer_thread.start()
 
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = []
+    try:
+        _dispatch(account_regions, resource_types, use_async)
+    finally:
+        # The writer only exits once _writer_done is set, so finalize on
+        # every path — including a crashed extraction
+        _finalize(writer_thread, filename, s3_bucket, s3_prefix)
+
+
+def _dispatch(account_regions, resource_types, use_async):
+    if use_async:
+        run_async_extraction(account_regions, resource_types)
+        return
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Phase 1: submit all STS calls at once so the per-account assume_role
+        # round trips overlap instead of serializing before any extraction
+        cred_futures = {}
         for account_id, regions in account_regions.items():
             role_arn = f"arn:aws:iam::{account_id}:role/tag-check-assume-role"
+            future = executor.submit(
+                assume_role, role_arn, f"GitHubTagCheck-{account_id}"
+            )
+            cred_futures[future] = (account_id, regions)
+
+        # Phase 2: as each account's credentials arrive, fan out its regions
+        futures = []
+        for cred_future in as_completed(cred_futures):
+            account_id, regions = cred_futures[cred_future]
             try:
-                creds = assume_role(
-                    role_arn, session_name=f"GitHubTagCheck-{account_id}"
-                )
-                for region in regions:
-                    futures.append(
-                        executor.submit(extract_resources, account_id, region, creds)
-                    )
+                creds = cred_future.result()
             except Exception as e:
                 logger.error(
                     f"Skipping account {account_id}: failed to assume role: {e}"
                 )
+                continue
+            for region in regions:
+                futures.append(
+                    executor.submit(
+                        extract_resources, account_id, region, creds, resource_types
+                    )
+                )
 
         for future in as_completed(futures):
             _ = future.result()
 
+
+def _finalize(writer_thread, filename, s3_bucket, s3_prefix):
     # Finalize CSV writing
-    csv_queue.put("DONE")
+    _writer_done.set()
+    _wake.set()
     writer_thread.join()
 
     print(f"\n✅ Output written to local file: {filename}\n")
@@ -195,6 +416,25 @@ if __name__ == "__main__":
         default="",
         help="Optional: Prefix (folder path) in the S3 bucket",
     )
+    parser.add_argument(
+        "--resource-types",
+        nargs="+",
+        help="Optional: Restrict extraction to these resource type filters "
+        "(e.g. ec2:instance s3 rds:db lambda:function)",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Optional: Use asyncio + aioboto3 instead of the thread pool "
+        "(requires aioboto3)",
+    )
     args = parser.parse_args()
 
-    main(args.accounts_csv, args.s3_bucket, args.s3_prefix)
+    main(
+        args.accounts_csv,
+        args.s3_bucket,
+        args.s3_prefix,
+        args.resource_types,
+        args.use_async,
+    )
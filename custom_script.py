@@ -1,22 +1,138 @@
+import base64
 import csv
+import json
+import time
 import boto3
+import botocore.config
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
+from botocore.signers import RequestSigner
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 import kubernetes.client as k8s
 import kubernetes.config
-import subprocess
-import tempfile
+import threading
 import os
 
+# boto3 releases the GIL during HTTP I/O, so threads scale with network RTT
+recommended_max_workers = min(32, (os.cpu_count() or 4) * 8)
+
+# Shared client config: default max_pool_connections=10 throttles the thread
+# pools above, and adaptive retries apply client-side token-bucket throttling
+BOTO_CFG = botocore.config.Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+def _client(session, service, region):
+    # Client construction re-parses the JSON service model every time, which is
+    # the dominant per-call overhead for small APIs — memoize on the Session
+    key = (service, region)
+    cache = getattr(session, "_client_cache", None)
+    if cache is not None:
+        client = cache.get(key)
+        if client is not None:
+            return client
+    # The Session is shared by every worker in the cluster pool and boto3
+    # documents client creation as not thread-safe, so misses build under a
+    # lock; the finished clients themselves are safe to share across threads
+    with _CLIENT_CACHE_LOCK:
+        cache = getattr(session, "_client_cache", None)
+        if cache is None:
+            cache = session._client_cache = {}
+        client = cache.get(key)
+        if client is None:
+            client = session.client(service, region_name=region, config=BOTO_CFG)
+            cache[key] = client
+    return client
+
+# The recommended-AMI parameters are scoped to (region, k8s version), and a
+# cluster's version never changes mid-run, so both lookups are safe to share
+# across clusters and accounts for the lifetime of the process
+_AMIS_CACHE = {}
+_AMIS_CACHE_LOCK = threading.Lock()
+_VERSION_CACHE = {}
+_VERSION_CACHE_LOCK = threading.Lock()
+
+# Cluster versions only move during control-plane upgrades, so they are also
+# persisted to disk with a 24h TTL and survive across cron/CI runs
+_VERSION_CACHE_PATH = os.path.expanduser("~/.cache/eks_inventory/cluster_versions.json")
+_VERSION_CACHE_TTL = 24 * 3600
+_version_cache_ts = {}
+_version_cache_loaded = False
+
+def _load_version_cache_locked():
+    global _version_cache_loaded
+    if _version_cache_loaded:
+        return
+    _version_cache_loaded = True
+    try:
+        with open(_VERSION_CACHE_PATH) as f:
+            data = json.load(f)
+    except Exception:
+        return
+    cutoff = time.time() - _VERSION_CACHE_TTL
+    for key, entry in data.items():
+        ts = entry.get("ts", 0)
+        if ts >= cutoff:
+            region, _, cluster = key.partition("/")
+            _VERSION_CACHE[(region, cluster)] = entry["version"]
+            _version_cache_ts[(region, cluster)] = ts
+
+def _save_version_cache_locked():
+    try:
+        os.makedirs(os.path.dirname(_VERSION_CACHE_PATH), exist_ok=True)
+        data = {
+            f"{region}/{cluster}": {"version": version, "ts": _version_cache_ts.get((region, cluster), int(time.time()))}
+            for (region, cluster), version in _VERSION_CACHE.items()
+        }
+        with open(_VERSION_CACHE_PATH, "w") as f:
+            json.dump(data, f)
+    except Exception:
+        pass
+
+# (region, ami_id) -> {CreationDate, Description}; fleets reuse the same AMIs
+# across clusters, so only newly seen images are described
+_AMI_CACHE = {}
+_AMI_CACHE_LOCK = threading.Lock()
+
+
+# Multipart upload tuning for the consolidated report; no-op for files < 8 MB
+S3_TRANSFER_CFG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=20,
+    use_threads=True,
+)
+
+# STS credentials are valid for an hour and are not region-scoped, so one
+# assume_role per (account, role) covers every region of that account
+_CREDS = {}
+_CREDS_LOCK = threading.Lock()
+
 def assume_role(account_id, role_name, region):
-    sts = boto3.client("sts", region_name=region)
-    print(f"🔄 Attempting to assume role: arn:aws:iam::{account_id}:role/{role_name}")
-    response = sts.assume_role(
-        RoleArn=f"arn:aws:iam::{account_id}:role/{role_name}",
-        RoleSessionName=f"AssumeRoleTest-{account_id}"
-    )
-    creds = response["Credentials"]
-    print(f"✅ Successfully assumed role: {role_name}")
+    key = (account_id, role_name)
+    with _CREDS_LOCK:
+        creds = _CREDS.get(key)
+    if creds is not None:
+        # Refresh lazily when within 5 minutes of expiry
+        remaining = creds["Expiration"] - datetime.now(timezone.utc)
+        if remaining.total_seconds() < 300:
+            creds = None
+    if creds is None:
+        sts = boto3.client("sts", region_name=region, config=BOTO_CFG)
+        print(f"🔄 Attempting to assume role: arn:aws:iam::{account_id}:role/{role_name}")
+        response = sts.assume_role(
+            RoleArn=f"arn:aws:iam::{account_id}:role/{role_name}",
+            RoleSessionName=f"AssumeRoleTest-{account_id}"
+        )
+        creds = response["Credentials"]
+        with _CREDS_LOCK:
+            _CREDS[key] = creds
+        print(f"✅ Successfully assumed role: {role_name}")
     return boto3.Session(
         aws_access_key_id=creds["AccessKeyId"],
         aws_secret_access_key=creds["SecretAccessKey"],
@@ -24,67 +140,91 @@ def assume_role(account_id, role_name, region):
         region_name=region
     )
 
-def print_caller_identity(session, account_id, region):
-    sts = session.client("sts", region_name=region)
-    identity = sts.get_caller_identity()
+def print_caller_identity(session, account_id, region, identity=None):
+    if identity is None:
+        sts = _client(session, "sts", region)
+        identity = sts.get_caller_identity()
     print(f"\n=== Account: {account_id} | Region: {region} | UserId: {identity['UserId']} | Arn: {identity['Arn']} ===")
 
 def list_eks_clusters(session, region):
     try:
-        eks = session.client("eks", region_name=region)
-        paginator = eks.get_paginator("list_clusters")
+        eks = _client(session, "eks", region)
         clusters = []
-        for page in paginator.paginate():
+        kwargs = {"maxResults": 100}
+        while True:
+            page = eks.list_clusters(**kwargs)
             clusters.extend(page.get("clusters", []))
+            token = page.get("nextToken")
+            if not token:
+                break
+            kwargs["nextToken"] = token
         return clusters
     except ClientError as e:
         print(f"❌ Failed to list EKS clusters in {region}: {e}")
         return []
 
 def get_latest_eks_amis(session, region, version):
+    with _AMIS_CACHE_LOCK:
+        cached = _AMIS_CACHE.get((region, version))
+    if cached is not None:
+        return cached, ""
     os_paths = [
         "amazon-linux-2/x86_64/standard",
         "amazon-linux-2023/x86_64/standard",
         "bottlerocket/x86_64/standard",
         "ubuntu/x86_64/standard",
     ]
-    os_amis = {}
     try:
-        ssm = session.client("ssm", region_name=region)
-        for os_path in os_paths:
-            param_name = f"/aws/service/eks/optimized-ami/{version}/{os_path}/recommended/image_id"
-            try:
-                response = ssm.get_parameter(Name=param_name)
-                os_amis[os_path] = response["Parameter"]["Value"]
-            except ClientError:
-                continue
+        ssm = _client(session, "ssm", region)
+        # One get_parameters round trip (up to 10 names) instead of four serial
+        # get_parameter calls; missing paths come back in InvalidParameters and
+        # are simply left out, matching the old per-parameter skip
+        name_to_path = {
+            f"/aws/service/eks/optimized-ami/{version}/{os_path}/recommended/image_id": os_path
+            for os_path in os_paths
+        }
+        response = ssm.get_parameters(Names=list(name_to_path))
+        os_amis = {
+            name_to_path[param["Name"]]: param["Value"]
+            for param in response.get("Parameters", [])
+        }
+        with _AMIS_CACHE_LOCK:
+            _AMIS_CACHE[(region, version)] = os_amis
         return os_amis, ""
     except ClientError as e:
         return {}, str(e)
 
-def parse_ami_info(ami_info):
+def parse_ami_info(ami_info, now=None):
     creation_date_str = ami_info.get("CreationDate", 0)
     ami_age = 0
     if creation_date_str and creation_date_str != 0:
         try:
             creation_date = datetime.fromisoformat(creation_date_str.replace('Z', '+00:00'))
-            now = datetime.now(timezone.utc)
+            if now is None:
+                now = datetime.now(timezone.utc)
             delta = now - creation_date
             ami_age = f"{delta.days} days"
         except Exception:
             ami_age = 0
     desc = str(ami_info.get("Description", "")).lower()
+    # Emit the SSM recommended-AMI path alongside the display name so callers
+    # need no second classification pass over OS_Version
     if "amazon linux 2023" in desc:
         os_version = "Amazon Linux 2023"
+        os_key = "amazon-linux-2023/x86_64/standard"
     elif "amazon linux 2" in desc:
         os_version = "Amazon Linux 2"
+        os_key = "amazon-linux-2/x86_64/standard"
     elif "bottlerocket" in desc:
         os_version = "Bottlerocket"
+        os_key = "bottlerocket/x86_64/standard"
     elif "ubuntu" in desc:
         os_version = "Ubuntu"
+        os_key = "ubuntu/x86_64/standard"
     else:
         os_version = 0
-    return ami_age, os_version
+        os_key = None
+    return ami_age, os_version, os_key
 
 
 # def get_node_readiness(instance_ids):
@@ -109,56 +249,92 @@ def parse_ami_info(ami_info):
 #         print(f"Failed to fetch node readiness from Kubernetes API: {e}")
 #         return {iid: "Unknown" for iid in instance_ids}
 
-def get_node_readiness(instance_ids, cluster_name, region, session):
-    kubeconfig_path = None
-    
-    # Save and restore credentials in a context manager style
-    original_aws_env = {
-        'AWS_ACCESS_KEY_ID': os.environ.get('AWS_ACCESS_KEY_ID'),
-        'AWS_SECRET_ACCESS_KEY': os.environ.get('AWS_SECRET_ACCESS_KEY'),
-        'AWS_SESSION_TOKEN': os.environ.get('AWS_SESSION_TOKEN'),
-        'AWS_DEFAULT_REGION': os.environ.get('AWS_DEFAULT_REGION')
+def _get_eks_bearer_token(session, cluster_name, region):
+    """Produce the same k8s-aws-v1 token `aws eks get-token` would, in process."""
+    sts = _client(session, "sts", region)
+    signer = RequestSigner(
+        sts.meta.service_model.service_id,
+        region,
+        "sts",
+        "v4",
+        session.get_credentials(),
+        session.events,
+    )
+    params = {
+        "method": "GET",
+        "url": f"https://sts.{region}.amazonaws.com/?Action=GetCallerIdentity&Version=2011-06-15",
+        "body": {},
+        "headers": {"x-k8s-aws-id": cluster_name},
+        "context": {},
     }
-    
+    signed_url = signer.generate_presigned_url(
+        params, region_name=region, expires_in=60, operation_name=""
+    )
+    return "k8s-aws-v1." + base64.urlsafe_b64encode(signed_url.encode()).decode().rstrip("=")
+
+def _get_core_v1(session, cluster_name, region):
+    # No cache: every (account, region) task runs on its own short-lived
+    # session and visits each cluster exactly once, so a run-wide cache
+    # could only ever hit through a recycled session id() — which would
+    # hand one account's authenticated client to another account scanning
+    # a same-named cluster
+
+    # Debug
+    sts = _client(session, "sts", region)
+    identity = sts.get_caller_identity()
+    print(f"🔍 Accessing EKS cluster '{cluster_name}' with identity: {identity['Arn']}")
+
+    # Built entirely in process: no `aws eks update-kubeconfig` subprocess,
+    # no temp kubeconfig, and — critically for the region and cluster
+    # pools — no credentials exported into the process-global environment,
+    # where workers on other accounts would race on them
     try:
-        creds = session.get_credentials().get_frozen_credentials()
-        
-        # Debug
-        sts = session.client("sts", region_name=region)
-        identity = sts.get_caller_identity()
-        print(f"🔍 Accessing EKS cluster '{cluster_name}' with identity: {identity['Arn']}")
-
-        # Temporarily set environment for this operation only
-        os.environ['AWS_ACCESS_KEY_ID'] = creds.access_key
-        os.environ['AWS_SECRET_ACCESS_KEY'] = creds.secret_key
-        os.environ['AWS_SESSION_TOKEN'] = creds.token
-        os.environ['AWS_DEFAULT_REGION'] = region
-
-        with tempfile.NamedTemporaryFile(delete=False, mode='w') as tmp:
-            kubeconfig_path = tmp.name
-
-        # Generate kubeconfig
-        result = subprocess.run(
-            ["aws", "eks", "update-kubeconfig", "--name", cluster_name, "--region", region, "--kubeconfig", kubeconfig_path],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode != 0:
-            print(f"❌ Failed to generate kubeconfig: {result.stderr}")
-            return {iid: "Unknown" for iid in instance_ids}
+        eks = _client(session, "eks", region)
+        cluster = eks.describe_cluster(name=cluster_name)["cluster"]
+        config_dict = {
+            "apiVersion": "v1",
+            "clusters": [{
+                "name": cluster_name,
+                "cluster": {
+                    "server": cluster["endpoint"],
+                    "certificate-authority-data": cluster["certificateAuthority"]["data"],
+                },
+            }],
+            "contexts": [{
+                "name": cluster_name,
+                "context": {"cluster": cluster_name, "user": cluster_name},
+            }],
+            "current-context": cluster_name,
+            "users": [{
+                "name": cluster_name,
+                "user": {"token": _get_eks_bearer_token(session, cluster_name, region)},
+            }],
+        }
+        api_client = kubernetes.config.new_client_from_config_dict(config_dict)
+    except ClientError as e:
+        print(f"❌ Failed to build Kubernetes client for cluster '{cluster_name}': {e}")
+        return None
+    return k8s.CoreV1Api(api_client)
 
-        # Load and use kubeconfig
-        kubernetes.config.load_kube_config(config_file=kubeconfig_path)
-        v1 = k8s.CoreV1Api()
-        k8s_nodes = v1.list_node()
+def get_node_readiness(instance_ids, cluster_name, region, session):
+    try:
+        v1 = _get_core_v1(session, cluster_name, region)
+        if v1 is None:
+            return {iid: "Unknown" for iid in instance_ids}
+        # resourceVersion=0 serves the list from the apiserver watch cache
+        # instead of a quorum etcd read — much cheaper on large clusters
+        k8s_nodes = v1.list_node(
+            resource_version="0", resource_version_match="NotOlderThan"
+        )
 
+        # Single pass: index every node by instance id, then answer lookups
+        wanted = set(instance_ids)
         readiness_map = {}
         for node in k8s_nodes.items:
             provider_id = node.spec.provider_id
             if provider_id and provider_id.startswith("aws:///"):
                 instance_id = provider_id.split("/")[-1]
-                if instance_id in instance_ids:
+                if instance_id in wanted:
                     conditions = node.status.conditions or []
                     ready = any(c.type == "Ready" and c.status == "True" for c in conditions)
                     readiness_map[instance_id] = "Ready" if ready else "NotReady"
@@ -181,78 +357,163 @@ def get_node_readiness(instance_ids, cluster_name, region, session):
         print(f"❌ Failed to fetch node readiness for cluster '{cluster_name}': {str(e)}")
         return {iid: "Unknown" for iid in instance_ids}
 
-    finally:
-        # Always restore original environment
-        for key, value in original_aws_env.items():
-            if value is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = value
-        
-        if kubeconfig_path and os.path.exists(kubeconfig_path):
-            try:
-                os.remove(kubeconfig_path)
-            except Exception:
-                pass
-
-
-def get_node_details(session, cluster_name, region):
+
+_CLUSTER_TAG_PREFIX = "kubernetes.io/cluster/"
+
+def _node_record(inst, now=None):
+    launch_time = inst.get("LaunchTime")
+    uptime = 0
+    if launch_time:
+        if now is None:
+            now = datetime.now(timezone.utc)
+        delta = now - launch_time.replace(tzinfo=timezone.utc)
+        days = delta.days
+        hours, _ = divmod(delta.seconds, 3600)
+        uptime = f"{days} days {hours} hours"
+    ami_id = inst.get("ImageId")
+    return {
+        "InstanceID": inst["InstanceId"],
+        "AMI_ID": ami_id if ami_id else 0,
+        "InstanceType": inst.get("InstanceType", 0),
+        "NodeState": inst.get("State", {}).get("Name", 0),
+        "NodeUptime": uptime
+    }
+
+def get_cluster_instances(session, cluster_name, region):
+    """Paginate the cluster's running instances; returns (nodes, ami_ids, instance_ids)."""
     try:
-        ec2 = session.client("ec2", region_name=region)
+        ec2 = _client(session, "ec2", region)
         filters = [
             {"Name": "instance-state-name", "Values": ["running"]},
-            {"Name": f"tag:kubernetes.io/cluster/{cluster_name}", "Values": ["owned", "shared"]}
+            {"Name": f"tag:{_CLUSTER_TAG_PREFIX}{cluster_name}", "Values": ["owned", "shared"]}
         ]
-        paginator = ec2.get_paginator("describe_instances")
         nodes, ami_ids, instance_ids = [], set(), []
-        for page in paginator.paginate(Filters=filters):
+        # One clock read for the whole scan instead of one per node
+        now = datetime.now(timezone.utc)
+        kwargs = {"Filters": filters, "MaxResults": 1000}
+        while True:
+            page = ec2.describe_instances(**kwargs)
             for res in page.get("Reservations", []):
                 for inst in res.get("Instances", []):
                     ami_id = inst.get("ImageId")
                     if ami_id:
                         ami_ids.add(ami_id)
                     instance_ids.append(inst["InstanceId"])
-                    launch_time = inst.get("LaunchTime")
-                    uptime = 0
-                    if launch_time:
-                        now = datetime.now(timezone.utc)
-                        delta = now - launch_time.replace(tzinfo=timezone.utc)
-                        days = delta.days
-                        hours, _ = divmod(delta.seconds, 3600)
-                        uptime = f"{days} days {hours} hours"
-                    nodes.append({
-                        "InstanceID": inst["InstanceId"],
-                        "AMI_ID": ami_id if ami_id else 0,
-                        "InstanceType": inst.get("InstanceType", 0),
-                        "NodeState": inst.get("State", {}).get("Name", 0),
-                        "NodeUptime": uptime
-                    })
-        ami_data = {}
-        if ami_ids:
-            ami_response = ec2.describe_images(ImageIds=list(ami_ids))
-            for img in ami_response.get("Images", []):
-                ami_data[img["ImageId"]] = {"CreationDate": img.get("CreationDate", 0), "Description": img.get("Description", "")}
-        for node in nodes:
-            ami_info = ami_data.get(node["AMI_ID"], {"CreationDate": 0, "Description": ""})
-            node["AMI_Age"], node["OS_Version"] = parse_ami_info(ami_info)
-        # readiness_map = get_node_readiness(instance_ids)
-        readiness_map = get_node_readiness(instance_ids, cluster_name, region, session)
-
-        for node in nodes:
-            node["NodeReadinessStatus"] = readiness_map.get(node["InstanceID"], 0)
-        return nodes
+                    nodes.append(_node_record(inst, now))
+            token = page.get("NextToken")
+            if not token:
+                break
+            kwargs["NextToken"] = token
+        return nodes, ami_ids, instance_ids
     except ClientError:
-        return []
+        return [], set(), []
+
+def get_all_region_nodes(session, region):
+    """One region-wide DescribeInstances, bucketed per cluster.
+
+    Replaces K per-cluster calls with a single wildcard tag-key scan;
+    returns {cluster: (nodes, ami_ids, instance_ids)}.
+    """
+    buckets = {}
+    try:
+        ec2 = _client(session, "ec2", region)
+        filters = [
+            {"Name": "instance-state-name", "Values": ["running"]},
+            {"Name": "tag-key", "Values": [_CLUSTER_TAG_PREFIX + "*"]},
+        ]
+        kwargs = {"Filters": filters, "MaxResults": 1000}
+        now = datetime.now(timezone.utc)
+        while True:
+            page = ec2.describe_instances(**kwargs)
+            for res in page.get("Reservations", []):
+                for inst in res.get("Instances", []):
+                    # An instance shared by several clusters carries one tag
+                    # per cluster; count it under every one of them, as the
+                    # per-cluster queries this scan replaced did
+                    for tag in inst.get("Tags", []):
+                        key = tag.get("Key", "")
+                        if not key.startswith(_CLUSTER_TAG_PREFIX):
+                            continue
+                        if tag.get("Value") not in ("owned", "shared"):
+                            continue
+                        cluster = key[len(_CLUSTER_TAG_PREFIX):]
+                        nodes, ami_ids, instance_ids = buckets.setdefault(cluster, ([], set(), []))
+                        ami_id = inst.get("ImageId")
+                        if ami_id:
+                            ami_ids.add(ami_id)
+                        instance_ids.append(inst["InstanceId"])
+                        nodes.append(_node_record(inst, now))
+            token = page.get("NextToken")
+            if not token:
+                break
+            kwargs["NextToken"] = token
+    except ClientError as e:
+        print(f"❌ Failed to describe EKS instances in {region}: {e}")
+    return buckets
+
+def get_ami_data(session, region, ami_ids):
+    """Resolve AMI metadata through the region cache, one describe_images for misses."""
+    ami_data = {}
+    if not ami_ids:
+        return ami_data
+    with _AMI_CACHE_LOCK:
+        for ami_id in ami_ids:
+            info = _AMI_CACHE.get((region, ami_id))
+            if info is not None:
+                ami_data[ami_id] = info
+    missing = [ami_id for ami_id in ami_ids if ami_id not in ami_data]
+    if missing:
+        try:
+            ec2 = _client(session, "ec2", region)
+            ami_response = ec2.describe_images(ImageIds=missing)
+        except ClientError:
+            return ami_data
+        fetched = {
+            img["ImageId"]: {"CreationDate": img.get("CreationDate", 0), "Description": img.get("Description", "")}
+            for img in ami_response.get("Images", [])
+        }
+        ami_data.update(fetched)
+        with _AMI_CACHE_LOCK:
+            for ami_id, info in fetched.items():
+                _AMI_CACHE[(region, ami_id)] = info
+    return ami_data
+
+def get_node_details(session, cluster_name, region, instances=None, ami_data=None):
+    if instances is None:
+        instances = get_cluster_instances(session, cluster_name, region)
+    nodes, ami_ids, instance_ids = instances
+    if ami_data is None:
+        ami_data = get_ami_data(session, region, ami_ids)
+    now = datetime.now(timezone.utc)
+    for node in nodes:
+        ami_info = ami_data.get(node["AMI_ID"], {"CreationDate": 0, "Description": ""})
+        node["AMI_Age"], node["OS_Version"], node["OS_Key"] = parse_ami_info(ami_info, now)
+    # readiness_map = get_node_readiness(instance_ids)
+    readiness_map = get_node_readiness(instance_ids, cluster_name, region, session)
+
+    for node in nodes:
+        node["NodeReadinessStatus"] = readiness_map.get(node["InstanceID"], 0)
+    return nodes
 
 def get_cluster_version(session, cluster_name, region):
+    with _VERSION_CACHE_LOCK:
+        _load_version_cache_locked()
+        cached = _VERSION_CACHE.get((region, cluster_name))
+    if cached is not None:
+        return cached
     try:
-        eks = session.client("eks", region_name=region)
-        return eks.describe_cluster(name=cluster_name)["cluster"]["version"]
+        eks = _client(session, "eks", region)
+        version = eks.describe_cluster(name=cluster_name)["cluster"]["version"]
+        with _VERSION_CACHE_LOCK:
+            _VERSION_CACHE[(region, cluster_name)] = version
+            _version_cache_ts[(region, cluster_name)] = int(time.time())
+            _save_version_cache_locked()
+        return version
     except ClientError:
         return "N/A"
 
 def get_current_identity(region=None):
-    return boto3.client("sts", region_name=region).get_caller_identity()
+    return boto3.client("sts", region_name=region, config=BOTO_CFG).get_caller_identity()
 
 def get_patch_status(ami_age_str):
     if ami_age_str and "days" in str(ami_age_str):
@@ -263,79 +524,118 @@ def get_patch_status(ami_age_str):
             return "False"
     return "False"
 
-def write_node_row(writer, account_id, region, cluster, cluster_version, node, latest_ami, patch_status, node_readiness):
-    # patch_status is already "True" or "False" from get_patch_status
-    # Print actual readiness status if available, else 0
-    readiness_val = node_readiness if node_readiness in ("Ready", "NotReady") else 0
-    writer.writerow([
-        account_id,
-        region,
-        cluster,
-        cluster_version,
-        node.get("InstanceID", 0) or 0,
-        node.get("AMI_ID", 0) or 0,
-        node.get("AMI_Age", 0) or 0,
-        node.get("OS_Version", 0) or 0,
-        node.get("InstanceType", 0) or 0,
-        node.get("NodeState", 0) or 0,
-        node.get("NodeUptime", 0) or 0,
-        str(latest_ami) if latest_ami is not None else "0",
-        patch_status,
-        readiness_val
-    ])
-
-def process_clusters(session, writer, account_id, region):
+def process_cluster(session, account_id, region, cluster, instances=None, ami_data=None):
+    rows = []
+    cluster_version = get_cluster_version(session, cluster, region)
+    latest_amis, error = get_latest_eks_amis(session, region, cluster_version)
+    if error:
+        print(f"Error fetching latest EKS AMIs for {region} cluster {cluster} (version {cluster_version}): {error}")
+    elif not latest_amis:
+        print(f"No latest EKS AMIs found for {region} cluster {cluster} (version {cluster_version})")
+    else:
+        for os_type, ami_id in latest_amis.items():
+            print(f"Latest EKS AMI for {region} cluster {cluster} (version {cluster_version}, {os_type}): {ami_id}")
+    nodes = get_node_details(session, cluster, region, instances, ami_data)
+    # The first four columns are identical for every node in the cluster
+    prefix = (account_id, region, cluster, cluster_version)
+    if nodes:
+        for node in nodes:
+            latest_ami = latest_amis.get(node.get("OS_Key"), 0)
+            patch_status = get_patch_status(node.get("AMI_Age", 0))
+            node_readiness = node.get("NodeReadinessStatus", 0)
+            # patch_status is already "True" or "False" from get_patch_status
+            # Print actual readiness status if available, else 0
+            readiness_val = node_readiness if node_readiness in ("Ready", "NotReady") else 0
+            print(f" - {cluster}: Instance {node['InstanceID']} (AMI: {node['AMI_ID']}, Type: {node['InstanceType']})")
+            rows.append(prefix + (
+                node.get("InstanceID", 0) or 0,
+                node.get("AMI_ID", 0) or 0,
+                node.get("AMI_Age", 0) or 0,
+                node.get("OS_Version", 0) or 0,
+                node.get("InstanceType", 0) or 0,
+                node.get("NodeState", 0) or 0,
+                node.get("NodeUptime", 0) or 0,
+                str(latest_ami),
+                patch_status,
+                readiness_val,
+            ))
+    else:
+        print(f" - {cluster}: (no running nodes)")
+        rows.append(prefix + (0, 0, 0, 0, 0, 0, 0, "0", 0, 0))
+    return rows
+
+def process_clusters(session, account_id, region):
     clusters = list_eks_clusters(session, region)
     print("EKS Clusters:")
-    for c in clusters:
-        cluster_version = get_cluster_version(session, c, region)
-        latest_amis, error = get_latest_eks_amis(session, region, cluster_version)
-        if error:
-            print(f"Error fetching latest EKS AMIs for {region} cluster {c} (version {cluster_version}): {error}")
-        elif not latest_amis:
-            print(f"No latest EKS AMIs found for {region} cluster {c} (version {cluster_version})")
-        else:
-            for os_type, ami_id in latest_amis.items():
-                print(f"Latest EKS AMI for {region} cluster {c} (version {cluster_version}, {os_type}): {ami_id}")
-        nodes = get_node_details(session, c, region)
-        if nodes:
-            for node in nodes:
-                os_version = str(node.get("OS_Version", "")).lower()
-                os_key = {
-                    "amazon linux 2": "amazon-linux-2/x86_64/standard",
-                    "amazon linux 2023": "amazon-linux-2023/x86_64/standard",
-                    "bottlerocket": "bottlerocket/x86_64/standard",
-                    "ubuntu": "ubuntu/x86_64/standard"
-                }.get(os_version, None)
-                latest_ami = latest_amis.get(os_key, 0) if latest_amis and os_key else 0
-                patch_status = get_patch_status(node.get("AMI_Age", 0))
-                node_readiness = node.get("NodeReadinessStatus", 0)
-                print(f" - {c}: Instance {node['InstanceID']} (AMI: {node['AMI_ID']}, Type: {node['InstanceType']})")
-                write_node_row(writer, account_id, region, c, cluster_version, node, latest_ami, patch_status, node_readiness)
-        else:
-            print(f" - {c}: (no running nodes)")
-            write_node_row(writer, account_id, region, c, cluster_version, {}, 0, 0, 0)
-    if not clusters:
+    rows = []
+    if clusters:
+        # Fan out across clusters too: each describe/list call blocks on network RTT
+        with ThreadPoolExecutor(max_workers=min(len(clusters), recommended_max_workers)) as pool:
+            # Phase 1: one region-wide DescribeInstances bucketed per cluster
+            region_nodes = get_all_region_nodes(session, region)
+            cluster_instances = {
+                c: region_nodes.get(c, ([], set(), [])) for c in clusters
+            }
+
+            # Phase 2: one batched describe_images for the union of AMI ids,
+            # instead of one call per cluster
+            all_ami_ids = set()
+            for _, ami_ids, _ in cluster_instances.values():
+                all_ami_ids.update(ami_ids)
+            ami_data = get_ami_data(session, region, all_ami_ids)
+
+            # Phase 3: per-cluster enrichment and row assembly
+            futures = [
+                pool.submit(process_cluster, session, account_id, region, c,
+                            cluster_instances[c], ami_data)
+                for c in clusters
+            ]
+            for future in as_completed(futures):
+                rows.extend(future.result())
+    else:
         print(" - (none found)")
+    return rows
+
+def process_region(account_id, role_name, region, current_identity, writer, writer_lock):
+    print(f"\n🔄 Assuming role in account {account_id} ({region}) ...")
+    current_account = current_identity["Account"] if current_identity else None
+    current_arn = current_identity["Arn"] if current_identity else ""
+    already_same_role = (
+        account_id == current_account and
+        (f"assumed-role/{role_name}" in current_arn or f":role/{role_name}" in current_arn)
+    )
+    try:
+        # Distinct Session per task: boto3 Sessions are not thread-safe to share
+        session = boto3.Session(region_name=region) if already_same_role else assume_role(account_id, role_name, region)
+        # On the same-account path we already know who we are — skip the
+        # per-region get_caller_identity round trip
+        print_caller_identity(session, account_id, region,
+                              current_identity if already_same_role else None)
+        rows = process_clusters(session, account_id, region)
+        with writer_lock:
+            writer.writerows(rows)
+        print("✅ Success")
+    except Exception as ex:
+        print(f"❌ Error processing account {account_id} in {region}: {ex}")
+    print(f"REGION_SUMMARY: account={account_id} region={region}")
 
 def main():
     csv_file = "accounts.csv"
     output_file = "output.csv"
     try:
         current_identity = get_current_identity()
-        current_account = current_identity["Account"]
-        current_arn = current_identity["Arn"]
-        print(f"🔑 Initial OIDC Identity: {current_arn}")
+        print(f"🔑 Initial OIDC Identity: {current_identity['Arn']}")
     except Exception:
-        current_account = None
-        current_arn = ""
-    with open(output_file, "w", newline="") as out_f:
+        current_identity = None
+    with open(output_file, "w", newline="", buffering=1 << 20) as out_f:
         writer = csv.writer(out_f)
         writer.writerow([
             "AccountID", "Region", "ClusterName", "ClusterVersion",
             "InstanceID", "AMI_ID", "AMI_Age", "OS_Version", "InstanceType", "NodeState", "NodeUptime",
             "Latest_EKS_AMI", "PatchPendingStatus", "NodeReadinessStatus"
         ])
+        writer_lock = threading.Lock()
+        tasks = []
         with open(csv_file, newline="") as f:
             reader = csv.DictReader(f)
             for row in reader:
@@ -344,21 +644,20 @@ def main():
                 region_field = row["region"].strip()
                 regions = [r.strip() for r in region_field.split(",") if r.strip()]
                 for region in regions:
-                    print(f"\n🔄 Assuming role in account {account_id} ({region}) ...")
-                    already_same_role = (
-                        account_id == current_account and
-                        (f"assumed-role/{role_name}" in current_arn or f":role/{role_name}" in current_arn)
-                    )
-                    try:
-                        session = boto3.Session(region_name=region) if already_same_role else assume_role(account_id, role_name, region)
-                        print_caller_identity(session, account_id, region)
-                        process_clusters(session, writer, account_id, region)
-                        print("✅ Success")
-                    except Exception as ex:
-                        print(f"❌ Error processing account {account_id} in {region}: {ex}")
-                    print(f"REGION_SUMMARY: account={account_id} region={region}")
+                    tasks.append((account_id, role_name, region))
+        with ThreadPoolExecutor(max_workers=recommended_max_workers) as pool:
+            futures = [
+                pool.submit(process_region, account_id, role_name, region,
+                            current_identity, writer, writer_lock)
+                for account_id, role_name, region in tasks
+            ]
+            for future in as_completed(futures):
+                future.result()
     try:
-        boto3.client("s3").upload_file(output_file, "vignesh-s3-debezium-test", "reports/output.csv")
+        boto3.client("s3", config=BOTO_CFG).upload_file(
+            output_file, "vignesh-s3-debezium-test", "reports/output.csv",
+            Config=S3_TRANSFER_CFG,
+        )
         print("✅ Uploaded output.csv to s3://vignesh-s3-debezium-test/reports/output.csv")
     except Exception as e:
         print(f"❌ Failed to upload output.csv to S3: {e}")
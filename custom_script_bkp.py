@@ -34,22 +34,45 @@ def get_cluster_nodes(session, region, cluster_name):
 
     filters = [
         {"Name": "tag:eks:cluster-name", "Values": [cluster_name]},
+        # The report includes stopped nodes on purpose; keep the IN-list tight
         {"Name": "instance-state-name", "Values": ["running", "stopped"]}
     ]
 
-    reservations = ec2.describe_instances(Filters=filters)["Reservations"]
-    return [i for r in reservations for i in r["Instances"]]
-
-def get_ami_details(session, region, ami_id):
+    # Max page size + token loop: the default 100-result pages mean 10x the
+    # round trips on large fleets, and this call also dropped page two before
+    instances = []
+    kwargs = {"Filters": filters, "MaxResults": 1000}
+    while True:
+        page = ec2.describe_instances(**kwargs)
+        for r in page["Reservations"]:
+            instances.extend(r["Instances"])
+        token = page.get("NextToken")
+        if not token:
+            break
+        kwargs["NextToken"] = token
+    return instances
+
+def get_ami_details(session, region, ami_ids):
+    # One DescribeImages for the cluster's unique AMIs instead of one per node
     ec2 = session.client("ec2", region_name=region)
-    image = ec2.describe_images(ImageIds=[ami_id])["Images"][0]
-    creation = datetime.fromisoformat(image["CreationDate"].replace("Z", "+00:00"))
-    age_days = (datetime.now(timezone.utc) - creation).days
-    return creation.date(), age_days
+    details = {}
+    if not ami_ids:
+        return details
+    now = datetime.now(timezone.utc)
+    for image in ec2.describe_images(ImageIds=list(ami_ids))["Images"]:
+        creation = datetime.fromisoformat(image["CreationDate"].replace("Z", "+00:00"))
+        details[image["ImageId"]] = (creation.date(), (now - creation).days)
+    return details
 
 def get_running_pods_per_node():
     v1 = k8s_client.CoreV1Api()
-    pods = v1.list_pod_for_all_namespaces().items
+    # Watch-cache read (resourceVersion=0) plus a server-side phase filter:
+    # we only count running pods, so don't pull terminal pods at all
+    pods = v1.list_pod_for_all_namespaces(
+        field_selector="status.phase=Running",
+        resource_version="0",
+        resource_version_match="NotOlderThan",
+    ).items
     pod_count = {}
     for pod in pods:
         if pod.spec.node_name:
@@ -61,13 +84,15 @@ def extract_cluster_data(account_id, region, cluster_name, session):
 
     pod_map = get_running_pods_per_node()
 
+    ami_details = get_ami_details(session, region, {n["ImageId"] for n in nodes})
+
     for node in nodes:
         instance_id = node["InstanceId"]
         ami_id = node["ImageId"]
         launch_time = node["LaunchTime"]
         uptime_days = (datetime.now(timezone.utc) - launch_time).days
 
-        ami_creation, ami_age = get_ami_details(session, region, ami_id)
+        ami_creation, ami_age = ami_details.get(ami_id, ("", 0))
 
         compliance = "COMPLIANT" if ami_age < COMPLIANCE_DAYS else "NON_COMPLIANT"
 
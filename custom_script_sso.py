@@ -1,4 +1,8 @@
 import csv
+import hashlib
+import json
+import time
+import webbrowser
 import boto3
 from botocore.exceptions import ClientError
 from datetime import datetime, timezone
@@ -17,6 +21,7 @@ from pathlib import Path
 SSO_START_URL = "https://d-9067ab41c2.awsapps.com/start/#/"  # Update with your SSO start URL
 SSO_REGION = "us-east-1"  # Update with your SSO region
 CONFIG_PATH = Path.home() / ".aws" / "config"
+SSO_CACHE_DIR = Path.home() / ".aws" / "sso" / "cache"
 
 # =========================
 # SSO Helper Functions
@@ -26,7 +31,8 @@ def backup_file(path: Path) -> None:
     if path.exists():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = path.with_suffix(f".backup_{timestamp}")
-        backup_path.write_text(path.read_text())
+        # Byte-for-byte copy (keeps metadata, skips decode/encode round trip)
+        shutil.copy2(path, backup_path)
         print(f"📋 Backed up existing file to {backup_path}")
 
 def setup_aws_config_for_accounts(accounts_data):
@@ -51,38 +57,89 @@ def setup_aws_config_for_accounts(accounts_data):
     
     if config_lines:
         CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # One pre-joined buffer, one append, one write syscall
         with CONFIG_PATH.open("a") as f:
-            f.write("\n" + "\n".join(config_lines))
+            f.write("\n".join(["", *config_lines]))
         print(f"✅ Added SSO profiles to {CONFIG_PATH}")
     else:
         print(f"ℹ️  All profiles already exist in {CONFIG_PATH}")
 
+def _sso_token_cache_file() -> Path:
+    # Same naming scheme the AWS CLI uses: sha1 of the start URL
+    return SSO_CACHE_DIR / f"{hashlib.sha1(SSO_START_URL.encode('utf-8')).hexdigest()}.json"
+
+def _cached_sso_token():
+    """Return a non-expired cached SSO access token for SSO_START_URL, if any."""
+    try:
+        data = json.loads(_sso_token_cache_file().read_text())
+        expires = datetime.fromisoformat(data["expiresAt"].replace("Z", "+00:00"))
+        if expires > datetime.now(timezone.utc):
+            return data.get("accessToken")
+    except Exception:
+        pass
+    return None
+
 def run_sso_login(profile_name: str) -> bool:
-    """Run AWS SSO login via CLI."""
+    """Authenticate against AWS SSO with the OIDC device flow (no CLI fork)."""
+    if _cached_sso_token():
+        print("✅ Reusing cached SSO token")
+        return True
+
     print("\n🔐 Starting AWS SSO login...")
     print("This will open your browser for authentication.")
-    
+
     try:
-        result = subprocess.run(
-            ["aws", "sso", "login", "--profile", profile_name],
-            capture_output=True,
-            text=True,
-            timeout=300
+        oidc = boto3.client("sso-oidc", region_name=SSO_REGION)
+        registration = oidc.register_client(
+            clientName="quicksight-eks-inventory", clientType="public"
         )
-        
-        if result.returncode == 0:
-            print("✅ SSO login successful!")
-            return True
-        else:
-            print(f"❌ SSO login failed: {result.stderr}")
+        device_auth = oidc.start_device_authorization(
+            clientId=registration["clientId"],
+            clientSecret=registration["clientSecret"],
+            startUrl=SSO_START_URL,
+        )
+        url = device_auth["verificationUriComplete"]
+        print(f"👉 Authorize this device at: {url}")
+        try:
+            webbrowser.open(url)
+        except Exception:
+            pass
+
+        deadline = time.time() + device_auth.get("expiresIn", 300)
+        interval = device_auth.get("interval", 5)
+        token_resp = None
+        while time.time() < deadline:
+            time.sleep(interval)
+            try:
+                token_resp = oidc.create_token(
+                    clientId=registration["clientId"],
+                    clientSecret=registration["clientSecret"],
+                    grantType="urn:ietf:params:oauth:grant-type:device_code",
+                    deviceCode=device_auth["deviceCode"],
+                )
+                break
+            except oidc.exceptions.AuthorizationPendingException:
+                continue
+            except oidc.exceptions.SlowDownException:
+                interval += 5
+        if token_resp is None:
+            print("❌ Login timed out")
             return False
-    except FileNotFoundError:
-        print("❌ AWS CLI not found. Please install it first:")
-        print("   pip install awscli")
-        return False
-    except subprocess.TimeoutExpired:
-        print("❌ Login timed out")
-        return False
+
+        # Write the token where botocore's SSO credential resolver expects it,
+        # so boto3.Session(profile_name=...) picks it up with no aws CLI at all
+        SSO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        expires_at = datetime.fromtimestamp(
+            time.time() + token_resp["expiresIn"], tz=timezone.utc
+        )
+        _sso_token_cache_file().write_text(json.dumps({
+            "startUrl": SSO_START_URL,
+            "region": SSO_REGION,
+            "accessToken": token_resp["accessToken"],
+            "expiresAt": expires_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }))
+        print("✅ SSO login successful!")
+        return True
     except Exception as e:
         print(f"❌ Error during SSO login: {e}")
         return False
@@ -1,21 +1,96 @@
+import base64
 import csv
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from botocore.signers import RequestSigner
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 import kubernetes.client as k8s
 import kubernetes.config
-import subprocess
-import tempfile
+import threading
 import os
 
+MAX_WORKERS = 16
+CLUSTER_WORKERS = 8
+
+# The default urllib3 pool of 10 connections stalls once region and cluster
+# workers stack up ("Connection pool is full" warnings); adaptive retries
+# back off client-side when the fan-out trips API throttling.
+BOTO_CFG = Config(
+    max_pool_connections=64,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Lowercased OS label -> SSM recommended-AMI path segment.
+_OS_KEY_MAP = {
+    "amazon linux 2": "amazon-linux-2/x86_64/standard",
+    "amazon linux 2023": "amazon-linux-2023/x86_64/standard",
+    "bottlerocket": "bottlerocket/x86_64/standard",
+    "ubuntu": "ubuntu/x86_64/standard",
+}
+
+# Ordered: "amazon linux 2023" must be tried before "amazon linux 2".
+_OS_PATTERNS = (
+    ("amazon linux 2023", "Amazon Linux 2023"),
+    ("amazon linux 2", "Amazon Linux 2"),
+    ("bottlerocket", "Bottlerocket"),
+    ("ubuntu", "Ubuntu"),
+)
+
+# boto3 client construction re-parses the service model (~tens of ms); cache
+# clients per thread so each worker builds sts/eks/ec2/ssm once. Thread-local
+# storage keeps us clear of boto3's client thread-safety caveats at creation.
+_tls = threading.local()
+
+def get_client(session, service, region):
+    cache = _tls.__dict__.setdefault("clients", {})
+    key = (id(session), service, region)
+    client = cache.get(key)
+    if client is None:
+        client = session.client(service, region_name=region, config=BOTO_CFG)
+        cache[key] = client
+    return client
+
+# One authenticated kube client per cluster: repeated readiness calls reuse
+# the TLS connection instead of re-describing the cluster and re-signing.
+_K8S_CLIENTS = {}
+_K8S_CLIENTS_LOCK = threading.Lock()
+
+# Caller identity never changes for the lifetime of a session; one STS
+# round trip per session is enough for every log line that wants the Arn.
+_IDENTITY_CACHE = {}
+_IDENTITY_LOCK = threading.Lock()
+
+# Recommended-AMI parameters move roughly monthly, so one lookup per
+# (region, version) covers every cluster sharing that version.
+_LATEST_AMIS_CACHE = {}
+_LATEST_AMIS_LOCK = threading.Lock()
+
+# DescribeImages metadata keyed by (region, ami_id); nodes across clusters
+# overwhelmingly share the same handful of AMIs.
+_AMI_INFO_CACHE = {}
+_AMI_INFO_LOCK = threading.Lock()
+
+def get_identity(session, region):
+    key = id(session)
+    with _IDENTITY_LOCK:
+        identity = _IDENTITY_CACHE.get(key)
+    if identity is None:
+        sts = get_client(session, "sts", region)
+        identity = sts.get_caller_identity()
+        with _IDENTITY_LOCK:
+            _IDENTITY_CACHE[key] = identity
+    return identity
+
 def print_caller_identity(session, account_id, region):
-    sts = session.client("sts", region_name=region)
-    identity = sts.get_caller_identity()
+    identity = get_identity(session, region)
     print(f"\n=== Account: {account_id} | Region: {region} | UserId: {identity['UserId']} | Arn: {identity['Arn']} ===")
 
 def list_eks_clusters(session, region):
     try:
-        eks = session.client("eks", region_name=region)
+        eks = get_client(session, "eks", region)
         paginator = eks.get_paginator("list_clusters")
         clusters = []
         for page in paginator.paginate():
@@ -32,97 +107,141 @@ def get_latest_eks_amis(session, region, version):
         "bottlerocket/x86_64/standard",
         "ubuntu/x86_64/standard",
     ]
+    with _LATEST_AMIS_LOCK:
+        cached = _LATEST_AMIS_CACHE.get((region, version))
+    if cached is not None:
+        return dict(cached), ""
     os_amis = {}
     try:
-        ssm = session.client("ssm", region_name=region)
-        for os_path in os_paths:
-            param_name = f"/aws/service/eks/optimized-ami/{version}/{os_path}/recommended/image_id"
-            try:
-                response = ssm.get_parameter(Name=param_name)
-                os_amis[os_path] = response["Parameter"]["Value"]
-            except ClientError:
-                continue
+        ssm = get_client(session, "ssm", region)
+        # One GetParameters round trip for all four names (the API takes up
+        # to 10) instead of four sequential GetParameter calls.
+        names = {
+            f"/aws/service/eks/optimized-ami/{version}/{os_path}/recommended/image_id": os_path
+            for os_path in os_paths
+        }
+        response = ssm.get_parameters(Names=list(names))
+        for param in response.get("Parameters", []):
+            os_amis[names[param["Name"]]] = param["Value"]
+        invalid = response.get("InvalidParameters", [])
+        if invalid:
+            print(f"⚠️  No recommended AMI parameter for: {', '.join(invalid)}")
+        with _LATEST_AMIS_LOCK:
+            _LATEST_AMIS_CACHE[(region, version)] = dict(os_amis)
         return os_amis, ""
     except ClientError as e:
         return {}, str(e)
 
-def parse_ami_info(ami_info):
+def parse_ami_info(ami_info, now=None):
     creation_date_str = ami_info.get("CreationDate", 0)
     ami_age = 0
     if creation_date_str and creation_date_str != 0:
         try:
             creation_date = datetime.fromisoformat(creation_date_str.replace('Z', '+00:00'))
-            now = datetime.now(timezone.utc)
-            delta = now - creation_date
-            ami_age = f"{delta.days} days"
+            if now is None:
+                now = datetime.now(timezone.utc)
+            # Keep the age as an integer; it is rendered as "N days" only
+            # when the CSV row is built
+            ami_age = (now - creation_date).days
         except Exception:
             ami_age = 0
     desc = str(ami_info.get("Description", "")).lower()
-    if "amazon linux 2023" in desc:
-        os_version = "Amazon Linux 2023"
-    elif "amazon linux 2" in desc:
-        os_version = "Amazon Linux 2"
-    elif "bottlerocket" in desc:
-        os_version = "Bottlerocket"
-    elif "ubuntu" in desc:
-        os_version = "Ubuntu"
-    else:
-        os_version = 0
+    os_version = next((label for needle, label in _OS_PATTERNS if needle in desc), 0)
     return ami_age, os_version
 
-def get_node_readiness(instance_ids, cluster_name, region, session):
-    kubeconfig_path = None
-    
-    # Save and restore credentials in a context manager style
-    original_aws_env = {
-        'AWS_ACCESS_KEY_ID': os.environ.get('AWS_ACCESS_KEY_ID'),
-        'AWS_SECRET_ACCESS_KEY': os.environ.get('AWS_SECRET_ACCESS_KEY'),
-        'AWS_SESSION_TOKEN': os.environ.get('AWS_SESSION_TOKEN'),
-        'AWS_DEFAULT_REGION': os.environ.get('AWS_DEFAULT_REGION')
+def get_eks_bearer_token(session, cluster_name, region):
+    """Produce the same k8s-aws-v1 token `aws eks get-token` would, in process."""
+    sts = get_client(session, "sts", region)
+    signer = RequestSigner(
+        sts.meta.service_model.service_id,
+        region,
+        "sts",
+        "v4",
+        session.get_credentials(),
+        session.events,
+    )
+    params = {
+        "method": "GET",
+        "url": f"https://sts.{region}.amazonaws.com/?Action=GetCallerIdentity&Version=2011-06-15",
+        "body": {},
+        "headers": {"x-k8s-aws-id": cluster_name},
+        "context": {},
     }
-    
+    signed_url = signer.generate_presigned_url(
+        params, region_name=region, expires_in=60, operation_name=""
+    )
+    return "k8s-aws-v1." + base64.urlsafe_b64encode(signed_url.encode()).decode().rstrip("=")
+
+def build_core_v1(session, cluster_name, region):
+    """Build a CoreV1Api for a cluster without shelling out or touching disk."""
+    eks = get_client(session, "eks", region)
+    cluster = eks.describe_cluster(name=cluster_name)["cluster"]
+    config_dict = {
+        "apiVersion": "v1",
+        "clusters": [{
+            "name": cluster_name,
+            "cluster": {
+                "server": cluster["endpoint"],
+                "certificate-authority-data": cluster["certificateAuthority"]["data"],
+            },
+        }],
+        "contexts": [{
+            "name": cluster_name,
+            "context": {"cluster": cluster_name, "user": cluster_name},
+        }],
+        "current-context": cluster_name,
+        "users": [{
+            "name": cluster_name,
+            "user": {"token": get_eks_bearer_token(session, cluster_name, region)},
+        }],
+    }
+    api_client = kubernetes.config.new_client_from_config_dict(config_dict)
+    return k8s.CoreV1Api(api_client)
+
+def get_core_v1(session, cluster_name, region):
+    key = (id(session), region, cluster_name)
+    with _K8S_CLIENTS_LOCK:
+        v1 = _K8S_CLIENTS.get(key)
+    if v1 is None:
+        v1 = build_core_v1(session, cluster_name, region)
+        with _K8S_CLIENTS_LOCK:
+            _K8S_CLIENTS[key] = v1
+    return v1
+
+def get_node_readiness(instance_ids, cluster_name, region, session):
+    if not instance_ids:
+        return {}
     try:
-        creds = session.get_credentials().get_frozen_credentials()
-        
-        # Debug
-        sts = session.client("sts", region_name=region)
-        identity = sts.get_caller_identity()
-        print(f"🔍 Accessing EKS cluster '{cluster_name}' with identity: {identity['Arn']}")
-
-        # Temporarily set environment for this operation only
-        os.environ['AWS_ACCESS_KEY_ID'] = creds.access_key
-        os.environ['AWS_SECRET_ACCESS_KEY'] = creds.secret_key
-        os.environ['AWS_SESSION_TOKEN'] = creds.token
-        os.environ['AWS_DEFAULT_REGION'] = region
-
-        with tempfile.NamedTemporaryFile(delete=False, mode='w') as tmp:
-            kubeconfig_path = tmp.name
-
-        # Generate kubeconfig
-        result = subprocess.run(
-            ["aws", "eks", "update-kubeconfig", "--name", cluster_name, "--region", region, "--kubeconfig", kubeconfig_path],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode != 0:
-            print(f"❌ Failed to generate kubeconfig: {result.stderr}")
-            return {iid: "Unknown" for iid in instance_ids}
+        if os.getenv("DEBUG"):
+            identity = get_identity(session, region)
+            print(f"🔍 Accessing EKS cluster '{cluster_name}' with identity: {identity['Arn']}")
 
-        # Load and use kubeconfig
-        kubernetes.config.load_kube_config(config_file=kubeconfig_path)
-        v1 = k8s.CoreV1Api()
-        k8s_nodes = v1.list_node()
+        # Everything happens in process: no `aws eks update-kubeconfig`
+        # subprocess, no temp kubeconfig, no credentials exported into the
+        # environment. This also makes the call safe under the cluster pool.
+        v1 = get_core_v1(session, cluster_name, region)
 
         readiness_map = {}
-        for node in k8s_nodes.items:
-            provider_id = node.spec.provider_id
-            if provider_id and provider_id.startswith("aws:///"):
-                instance_id = provider_id.split("/")[-1]
-                if instance_id in instance_ids:
-                    conditions = node.status.conditions or []
-                    ready = any(c.type == "Ready" and c.status == "True" for c in conditions)
-                    readiness_map[instance_id] = "Ready" if ready else "NotReady"
+        wanted = set(instance_ids)
+        # resource_version="0" serves the first page from the API server's
+        # watch cache instead of a quorum etcd read; limit=500 keeps each
+        # response bounded on big clusters. Continue tokens pin the snapshot,
+        # so resource_version is only sent on the first request.
+        kwargs = {"resource_version": "0", "limit": 500}
+        while True:
+            k8s_nodes = v1.list_node(**kwargs)
+            for node in k8s_nodes.items:
+                provider_id = node.spec.provider_id
+                if provider_id and provider_id.startswith("aws:///"):
+                    instance_id = provider_id.split("/")[-1]
+                    if instance_id in wanted:
+                        conditions = node.status.conditions or []
+                        ready = any(c.type == "Ready" and c.status == "True" for c in conditions)
+                        readiness_map[instance_id] = "Ready" if ready else "NotReady"
+            continue_token = k8s_nodes.metadata._continue
+            if not continue_token:
+                break
+            kwargs = {"limit": 500, "_continue": continue_token}
 
         for iid in instance_ids:
             readiness_map.setdefault(iid, "Unknown")
@@ -142,72 +261,136 @@ def get_node_readiness(instance_ids, cluster_name, region, session):
         print(f"❌ Failed to fetch node readiness for cluster '{cluster_name}': {str(e)}")
         return {iid: "Unknown" for iid in instance_ids}
 
-    finally:
-        # Always restore original environment
-        for key, value in original_aws_env.items():
-            if value is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = value
-        
-        if kubeconfig_path and os.path.exists(kubeconfig_path):
-            try:
-                os.remove(kubeconfig_path)
-            except Exception:
-                pass
-
 
-def get_node_details(session, cluster_name, region):
+def get_cluster_instances(session, cluster_name, region, now=None):
+    """Collect node records plus the AMI and instance ids for one cluster."""
+    # A single timestamp per scan is plenty for day-granularity uptime and
+    # avoids a clock read (and tz resolution) per instance.
+    if now is None:
+        now = datetime.now(timezone.utc)
     try:
-        ec2 = session.client("ec2", region_name=region)
+        ec2 = get_client(session, "ec2", region)
         filters = [
             {"Name": "instance-state-name", "Values": ["running"]},
             {"Name": f"tag:kubernetes.io/cluster/{cluster_name}", "Values": ["owned", "shared"]}
         ]
         paginator = ec2.get_paginator("describe_instances")
         nodes, ami_ids, instance_ids = [], set(), []
-        for page in paginator.paginate(Filters=filters):
+        # Max page size: 10x fewer round trips than the default 100-result
+        # pages on big node groups, and we only read five fields per instance.
+        for page in paginator.paginate(Filters=filters, PaginationConfig={"PageSize": 1000}):
             for res in page.get("Reservations", []):
                 for inst in res.get("Instances", []):
                     ami_id = inst.get("ImageId")
                     if ami_id:
                         ami_ids.add(ami_id)
                     instance_ids.append(inst["InstanceId"])
-                    launch_time = inst.get("LaunchTime")
-                    uptime = 0
-                    if launch_time:
-                        now = datetime.now(timezone.utc)
-                        delta = now - launch_time.replace(tzinfo=timezone.utc)
-                        days = delta.days
-                        hours, _ = divmod(delta.seconds, 3600)
-                        uptime = f"{days} days {hours} hours"
-                    nodes.append({
-                        "InstanceID": inst["InstanceId"],
-                        "AMI_ID": ami_id if ami_id else 0,
-                        "InstanceType": inst.get("InstanceType", 0),
-                        "NodeState": inst.get("State", {}).get("Name", 0),
-                        "NodeUptime": uptime
-                    })
-        ami_data = {}
-        if ami_ids:
-            ami_response = ec2.describe_images(ImageIds=list(ami_ids))
-            for img in ami_response.get("Images", []):
-                ami_data[img["ImageId"]] = {"CreationDate": img.get("CreationDate", 0), "Description": img.get("Description", "")}
-        for node in nodes:
-            ami_info = ami_data.get(node["AMI_ID"], {"CreationDate": 0, "Description": ""})
-            node["AMI_Age"], node["OS_Version"] = parse_ami_info(ami_info)
-        # readiness_map = get_node_readiness(instance_ids)
-        readiness_map = get_node_readiness(instance_ids, cluster_name, region, session)
+                    nodes.append(node_record(inst, now))
+        return nodes, ami_ids, instance_ids
+    except ClientError:
+        return [], set(), []
 
-        for node in nodes:
-            node["NodeReadinessStatus"] = readiness_map.get(node["InstanceID"], 0)
-        return nodes
+def node_record(inst, now):
+    launch_time = inst.get("LaunchTime")
+    uptime = 0
+    if launch_time:
+        delta = now - launch_time.replace(tzinfo=timezone.utc)
+        hours, _ = divmod(delta.seconds, 3600)
+        uptime = f"{delta.days} days {hours} hours"
+    return {
+        "InstanceID": inst["InstanceId"],
+        "AMI_ID": inst.get("ImageId") or 0,
+        "InstanceType": inst.get("InstanceType", 0),
+        "NodeState": inst.get("State", {}).get("Name", 0),
+        "NodeUptime": uptime,
+    }
+
+_CLUSTER_TAG_PREFIX = "kubernetes.io/cluster/"
+
+def get_region_instances(session, region, clusters, now=None):
+    """One DescribeInstances for all the region's clusters, split by tag.
+
+    N per-cluster scans become a single tag-key-filtered scan; each instance
+    is bucketed by its kubernetes.io/cluster/<name> tag afterwards.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    buckets = {c: ([], set(), []) for c in clusters}
+    try:
+        ec2 = get_client(session, "ec2", region)
+        filters = [
+            {"Name": "instance-state-name", "Values": ["running"]},
+            {"Name": "tag-key", "Values": [f"{_CLUSTER_TAG_PREFIX}{c}" for c in clusters]},
+        ]
+        paginator = ec2.get_paginator("describe_instances")
+        for page in paginator.paginate(Filters=filters, PaginationConfig={"PageSize": 1000}):
+            for res in page.get("Reservations", []):
+                for inst in res.get("Instances", []):
+                    # Same semantics as the old per-cluster queries: only
+                    # owned/shared tag values count, and an instance shared
+                    # by several of our clusters lands in every bucket
+                    for tag in inst.get("Tags", []):
+                        if not tag["Key"].startswith(_CLUSTER_TAG_PREFIX):
+                            continue
+                        if tag.get("Value") not in ("owned", "shared"):
+                            continue
+                        bucket = buckets.get(tag["Key"][len(_CLUSTER_TAG_PREFIX):])
+                        if bucket is None:
+                            continue
+                        nodes, ami_ids, instance_ids = bucket
+                        ami_id = inst.get("ImageId")
+                        if ami_id:
+                            ami_ids.add(ami_id)
+                        instance_ids.append(inst["InstanceId"])
+                        nodes.append(node_record(inst, now))
     except ClientError:
-        return []
+        pass
+    return buckets
+
+def get_ami_data(session, region, ami_ids):
+    """Resolve AMI metadata through the cache, describing only unseen ids."""
+    ami_data = {}
+    with _AMI_INFO_LOCK:
+        for ami_id in ami_ids:
+            info = _AMI_INFO_CACHE.get((region, ami_id))
+            if info is not None:
+                ami_data[ami_id] = info
+    missing = set(ami_ids) - ami_data.keys()
+    if missing:
+        ec2 = get_client(session, "ec2", region)
+        ami_response = ec2.describe_images(ImageIds=list(missing))
+        fetched = {}
+        for img in ami_response.get("Images", []):
+            fetched[img["ImageId"]] = {"CreationDate": img.get("CreationDate", 0), "Description": img.get("Description", "")}
+        ami_data.update(fetched)
+        with _AMI_INFO_LOCK:
+            for ami_id, info in fetched.items():
+                _AMI_INFO_CACHE[(region, ami_id)] = info
+    return ami_data
+
+def get_node_details(session, cluster_name, region, instances=None, ami_data=None, now=None):
+    if now is None:
+        now = datetime.now(timezone.utc)
+    if instances is None:
+        instances = get_cluster_instances(session, cluster_name, region, now=now)
+    nodes, ami_ids, instance_ids = instances
+    if ami_data is None:
+        ami_data = get_ami_data(session, region, ami_ids)
+    for node in nodes:
+        ami_info = ami_data.get(node["AMI_ID"], {"CreationDate": 0, "Description": ""})
+        node["AMI_Age"], node["OS_Version"] = parse_ami_info(ami_info, now)
+    # No instances means nothing to look up — skip the cluster auth and
+    # list_node round trip entirely
+    if not instance_ids:
+        return nodes
+    readiness_map = get_node_readiness(instance_ids, cluster_name, region, session)
+    for node in nodes:
+        node["NodeReadinessStatus"] = readiness_map.get(node["InstanceID"], 0)
+    return nodes
 
 def get_cluster_version(session, cluster_name, region):
     try:
-        eks = session.client("eks", region_name=region)
+        eks = get_client(session, "eks", region)
         return eks.describe_cluster(name=cluster_name)["cluster"]["version"]
     except ClientError:
         return "N/A"
@@ -215,27 +398,25 @@ def get_cluster_version(session, cluster_name, region):
 def get_current_identity(region=None):
     return boto3.client("sts", region_name=region).get_caller_identity()
 
-def get_patch_status(ami_age_str):
-    if ami_age_str and "days" in str(ami_age_str):
-        try:
-            days = int(str(ami_age_str).split()[0])
-            return "False" if days < 30 else "True"
-        except Exception:
-            return "False"
-    return "False"
+def get_patch_status(ami_age_days):
+    try:
+        return "True" if int(ami_age_days) >= 30 else "False"
+    except (TypeError, ValueError):
+        return "False"
 
-def write_node_row(writer, account_id, region, cluster, cluster_version, node, latest_ami, patch_status, node_readiness):
+def node_row(account_id, region, cluster, cluster_version, node, latest_ami, patch_status, node_readiness):
     # patch_status is already "True" or "False" from get_patch_status
     # Print actual readiness status if available, else 0
     readiness_val = node_readiness if node_readiness in ("Ready", "NotReady") else 0
-    writer.writerow([
+    ami_age_days = node.get("AMI_Age", 0) or 0
+    return [
         account_id,
         region,
         cluster,
         cluster_version,
         node.get("InstanceID", 0) or 0,
         node.get("AMI_ID", 0) or 0,
-        node.get("AMI_Age", 0) or 0,
+        f"{ami_age_days} days" if ami_age_days else 0,
         node.get("OS_Version", 0) or 0,
         node.get("InstanceType", 0) or 0,
         node.get("NodeState", 0) or 0,
@@ -243,41 +424,204 @@ def write_node_row(writer, account_id, region, cluster, cluster_version, node, l
         str(latest_ami) if latest_ami is not None else "0",
         patch_status,
         readiness_val
-    ])
+    ]
+
+def process_cluster(session, account_id, region, c, instances=None, ami_data=None, now=None):
+    rows = []
+    cluster_version = get_cluster_version(session, c, region)
+    latest_amis, error = get_latest_eks_amis(session, region, cluster_version)
+    if error:
+        print(f"Error fetching latest EKS AMIs for {region} cluster {c} (version {cluster_version}): {error}")
+    elif not latest_amis:
+        print(f"No latest EKS AMIs found for {region} cluster {c} (version {cluster_version})")
+    else:
+        for os_type, ami_id in latest_amis.items():
+            print(f"Latest EKS AMI for {region} cluster {c} (version {cluster_version}, {os_type}): {ami_id}")
+    nodes = get_node_details(session, c, region, instances=instances, ami_data=ami_data, now=now)
+    rows.extend(build_cluster_rows(account_id, region, c, cluster_version, latest_amis, nodes))
+    return rows
 
-def process_clusters(session, writer, account_id, region):
+def build_cluster_rows(account_id, region, c, cluster_version, latest_amis, nodes):
+    rows = []
+    if nodes:
+        for node in nodes:
+            os_version = str(node.get("OS_Version", "")).lower()
+            os_key = _OS_KEY_MAP.get(os_version)
+            latest_ami = latest_amis.get(os_key, 0) if latest_amis and os_key else 0
+            patch_status = get_patch_status(node.get("AMI_Age", 0))
+            node_readiness = node.get("NodeReadinessStatus", 0)
+            print(f" - {c}: Instance {node['InstanceID']} (AMI: {node['AMI_ID']}, Type: {node['InstanceType']})")
+            rows.append(node_row(account_id, region, c, cluster_version, node, latest_ami, patch_status, node_readiness))
+    else:
+        print(f" - {c}: (no running nodes)")
+        rows.append(node_row(account_id, region, c, cluster_version, {}, 0, 0, 0))
+    return rows
+
+def run_async_inventory(tasks):
+    """Collect rows for all (account, region) tasks on one asyncio event loop.
+
+    Optional fast path (EKS_INVENTORY_ASYNC=1): the AWS fan-out runs through
+    aiobotocore on a single event loop with a bounded semaphore instead of
+    the thread pool. The kubernetes readiness check stays synchronous and is
+    pushed onto worker threads with asyncio.to_thread.
+    """
+    import asyncio
+    from aiobotocore.session import get_session
+
+    async def latest_amis_for(ssm, region, version):
+        with _LATEST_AMIS_LOCK:
+            cached = _LATEST_AMIS_CACHE.get((region, version))
+        if cached is not None:
+            return dict(cached)
+        names = {
+            f"/aws/service/eks/optimized-ami/{version}/{os_path}/recommended/image_id": os_path
+            for os_path in [
+                "amazon-linux-2/x86_64/standard",
+                "amazon-linux-2023/x86_64/standard",
+                "bottlerocket/x86_64/standard",
+                "ubuntu/x86_64/standard",
+            ]
+        }
+        response = await ssm.get_parameters(Names=list(names))
+        os_amis = {names[p["Name"]]: p["Value"] for p in response.get("Parameters", [])}
+        with _LATEST_AMIS_LOCK:
+            _LATEST_AMIS_CACHE[(region, version)] = dict(os_amis)
+        return os_amis
+
+    async def cluster_instances_for(ec2, cluster_name):
+        now = datetime.now(timezone.utc)
+        nodes, ami_ids, instance_ids = [], set(), []
+        paginator = ec2.get_paginator("describe_instances")
+        async for page in paginator.paginate(
+            Filters=[
+                {"Name": "instance-state-name", "Values": ["running"]},
+                {"Name": f"tag:kubernetes.io/cluster/{cluster_name}", "Values": ["owned", "shared"]},
+            ],
+            PaginationConfig={"PageSize": 1000},
+        ):
+            for res in page.get("Reservations", []):
+                for inst in res.get("Instances", []):
+                    ami_id = inst.get("ImageId")
+                    if ami_id:
+                        ami_ids.add(ami_id)
+                    instance_ids.append(inst["InstanceId"])
+                    launch_time = inst.get("LaunchTime")
+                    uptime = 0
+                    if launch_time:
+                        delta = now - launch_time.replace(tzinfo=timezone.utc)
+                        hours, _ = divmod(delta.seconds, 3600)
+                        uptime = f"{delta.days} days {hours} hours"
+                    nodes.append({
+                        "InstanceID": inst["InstanceId"],
+                        "AMI_ID": ami_id if ami_id else 0,
+                        "InstanceType": inst.get("InstanceType", 0),
+                        "NodeState": inst.get("State", {}).get("Name", 0),
+                        "NodeUptime": uptime,
+                    })
+        return nodes, ami_ids, instance_ids
+
+    async def region_rows(aio, sem, account_id, region):
+        async with sem:
+            print(f"\n🔄 Processing account {account_id} ({region}) ...")
+            session = boto3.Session(region_name=region)
+            async with aio.create_client("eks", region_name=region, config=BOTO_CFG) as eks, \
+                    aio.create_client("ssm", region_name=region, config=BOTO_CFG) as ssm, \
+                    aio.create_client("ec2", region_name=region, config=BOTO_CFG) as ec2:
+                clusters = []
+                async for page in eks.get_paginator("list_clusters").paginate():
+                    clusters.extend(page.get("clusters", []))
+                print("EKS Clusters:")
+                if not clusters:
+                    print(" - (none found)")
+                    return []
+                versions, instances = await asyncio.gather(
+                    asyncio.gather(*[eks.describe_cluster(name=c) for c in clusters]),
+                    asyncio.gather(*[cluster_instances_for(ec2, c) for c in clusters]),
+                )
+                versions = [v["cluster"]["version"] for v in versions]
+                amis = await asyncio.gather(
+                    *[latest_amis_for(ssm, region, v) for v in versions]
+                )
+                all_ami_ids = set()
+                for _, ami_ids, _ in instances:
+                    all_ami_ids.update(ami_ids)
+                with _AMI_INFO_LOCK:
+                    missing = {a for a in all_ami_ids if (region, a) not in _AMI_INFO_CACHE}
+                if missing:
+                    response = await ec2.describe_images(ImageIds=list(missing))
+                    with _AMI_INFO_LOCK:
+                        for img in response.get("Images", []):
+                            _AMI_INFO_CACHE[(region, img["ImageId"])] = {
+                                "CreationDate": img.get("CreationDate", 0),
+                                "Description": img.get("Description", ""),
+                            }
+                rows = []
+                for c, version, latest_amis, inst in zip(clusters, versions, amis, instances):
+                    # get_node_details only does the kubernetes readiness call
+                    # once instances and AMI metadata are pre-supplied
+                    nodes = await asyncio.to_thread(
+                        get_node_details, session, c, region, inst,
+                        get_ami_data(session, region, inst[1]),
+                    )
+                    rows.extend(build_cluster_rows(account_id, region, c, version, latest_amis, nodes))
+                return rows
+
+    async def inventory():
+        sem = asyncio.Semaphore(32)
+        aio = get_session()
+        rows = []
+        results = await asyncio.gather(
+            *[region_rows(aio, sem, a, r) for a, r in tasks],
+            return_exceptions=True,
+        )
+        for (account_id, region), result in zip(tasks, results):
+            if isinstance(result, Exception):
+                print(f"❌ Error processing account {account_id} in {region}: {result}")
+            else:
+                rows.extend(result)
+            print(f"REGION_SUMMARY: account={account_id} region={region}")
+        return rows
+
+    return asyncio.run(inventory())
+
+def process_clusters(session, account_id, region):
     clusters = list_eks_clusters(session, region)
     print("EKS Clusters:")
-    for c in clusters:
-        cluster_version = get_cluster_version(session, c, region)
-        latest_amis, error = get_latest_eks_amis(session, region, cluster_version)
-        if error:
-            print(f"Error fetching latest EKS AMIs for {region} cluster {c} (version {cluster_version}): {error}")
-        elif not latest_amis:
-            print(f"No latest EKS AMIs found for {region} cluster {c} (version {cluster_version})")
-        else:
-            for os_type, ami_id in latest_amis.items():
-                print(f"Latest EKS AMI for {region} cluster {c} (version {cluster_version}, {os_type}): {ami_id}")
-        nodes = get_node_details(session, c, region)
-        if nodes:
-            for node in nodes:
-                os_version = str(node.get("OS_Version", "")).lower()
-                os_key = {
-                    "amazon linux 2": "amazon-linux-2/x86_64/standard",
-                    "amazon linux 2023": "amazon-linux-2023/x86_64/standard",
-                    "bottlerocket": "bottlerocket/x86_64/standard",
-                    "ubuntu": "ubuntu/x86_64/standard"
-                }.get(os_version, None)
-                latest_ami = latest_amis.get(os_key, 0) if latest_amis and os_key else 0
-                patch_status = get_patch_status(node.get("AMI_Age", 0))
-                node_readiness = node.get("NodeReadinessStatus", 0)
-                print(f" - {c}: Instance {node['InstanceID']} (AMI: {node['AMI_ID']}, Type: {node['InstanceType']})")
-                write_node_row(writer, account_id, region, c, cluster_version, node, latest_ami, patch_status, node_readiness)
-        else:
-            print(f" - {c}: (no running nodes)")
-            write_node_row(writer, account_id, region, c, cluster_version, {}, 0, 0, 0)
     if not clusters:
         print(" - (none found)")
+        return []
+    rows = []
+    # Overlap the SSM/EKS/EC2 latency across clusters; region time becomes
+    # roughly the slowest cluster rather than the sum of all of them.
+    with ThreadPoolExecutor(max_workers=min(CLUSTER_WORKERS, len(clusters))) as executor:
+        # Phase 1: one EC2 scan for the whole region, then one DescribeImages
+        # for the union of its AMI ids — constant EC2 call counts no matter
+        # how many clusters the region holds.
+        now = datetime.now(timezone.utc)
+        instances_by_cluster = get_region_instances(session, region, clusters, now=now)
+        all_ami_ids = set()
+        for _, ami_ids, _ in instances_by_cluster.values():
+            all_ami_ids.update(ami_ids)
+        ami_data = get_ami_data(session, region, all_ami_ids)
+        # Phase 2: per-cluster version/SSM/readiness work against the shared
+        # AMI metadata.
+        for cluster_rows in executor.map(
+            lambda c: process_cluster(
+                session, account_id, region, c,
+                instances=instances_by_cluster[c], ami_data=ami_data, now=now,
+            ),
+            clusters,
+        ):
+            rows.extend(cluster_rows)
+    return rows
+
+def process_account_region(account_id, region):
+    # Each worker gets its own Session: sessions are not thread-safe, but the
+    # clients built from one inside a single worker are fine to share there.
+    print(f"\n🔄 Processing account {account_id} ({region}) ...")
+    session = boto3.Session(region_name=region)
+    print_caller_identity(session, account_id, region)
+    return process_clusters(session, account_id, region)
 
 def main():
     csv_file = "accounts.csv"
@@ -290,29 +634,45 @@ def main():
     except Exception:
         current_account = None
         current_arn = ""
-    with open(output_file, "w", newline="") as out_f:
+    tasks = []
+    with open(csv_file, newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            account_id = row["account_id"].strip()
+            region_field = row["region"].strip()
+            for region in [r.strip() for r in region_field.split(",") if r.strip()]:
+                tasks.append((account_id, region))
+    writer_lock = threading.Lock()
+    # 1 MiB userspace buffer: rows already arrive in per-region batches via
+    # writerows, so flushes to disk happen a few times per run, not per row.
+    with open(output_file, "w", newline="", buffering=1 << 20) as out_f:
         writer = csv.writer(out_f)
         writer.writerow([
             "AccountID", "Region", "ClusterName", "ClusterVersion",
             "InstanceID", "AMI_ID", "AMI_Age", "OS_Version", "InstanceType", "NodeState", "NodeUptime",
             "Latest_EKS_AMI", "PatchPendingStatus", "NodeReadinessStatus"
         ])
-        with open(csv_file, newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                account_id = row["account_id"].strip()
-                region_field = row["region"].strip()
-                regions = [r.strip() for r in region_field.split(",") if r.strip()]
-                for region in regions:
-                    print(f"\n🔄 Processing account {account_id} ({region}) ...")
-                    try:
-                        session = boto3.Session(region_name=region)
-                        print_caller_identity(session, account_id, region)
-                        process_clusters(session, writer, account_id, region)
-                        print("✅ Success")
-                    except Exception as ex:
-                        print(f"❌ Error processing account {account_id} in {region}: {ex}")
-                    print(f"REGION_SUMMARY: account={account_id} region={region}")
+        if os.getenv("EKS_INVENTORY_ASYNC"):
+            writer.writerows(run_async_inventory(tasks))
+            return
+        # The work is almost entirely waiting on AWS APIs, so account/region
+        # pairs fan out across threads and the wall clock tracks the slowest
+        # region instead of the sum of all of them.
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(process_account_region, account_id, region): (account_id, region)
+                for account_id, region in tasks
+            }
+            for future in as_completed(futures):
+                account_id, region = futures[future]
+                try:
+                    rows = future.result()
+                    with writer_lock:
+                        writer.writerows(rows)
+                    print("✅ Success")
+                except Exception as ex:
+                    print(f"❌ Error processing account {account_id} in {region}: {ex}")
+                print(f"REGION_SUMMARY: account={account_id} region={region}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
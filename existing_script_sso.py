@@ -1,12 +1,15 @@
 import os
 import json
 import getpass
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.parse import quote
 from typing import Dict, Optional
  
 import requests
+from requests.adapters import HTTPAdapter
 import questionary
 from questionary import Choice
  
@@ -31,6 +34,16 @@ API_URL_TEMPLATE = (
 )
  
 CREDENTIALS_PATH = Path.home() / ".aws" / "credentials"
+
+# One pooled HTTP session for every federation call: the TLS handshakes to
+# portal.sso and signin.aws.amazon.com are paid once, not per account.
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+
+# Fetched role credentials survive process restarts here so that reopening
+# the console within a session lifetime skips the federation round-trips.
+COLLECTED_CACHE_PATH = Path.home() / ".aws" / "sso_cache" / "collected.json"
+CRED_TTL_SECONDS = 3600
  
 # Sentinel values for menu navigation
 BACK = "__BACK__"
@@ -51,13 +64,38 @@ def ensure_bearer_token(existing: Optional[str] = None) -> str:
     return token
  
  
+def load_cached_creds() -> Dict[str, Dict[str, str]]:
+    """Load previously fetched creds from disk if they have not expired."""
+    try:
+        data = json.loads(COLLECTED_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+    if data.get("expiry", 0) <= time.time():
+        return {}
+    return data.get("collected", {})
+ 
+ 
+def save_cached_creds(collected: Dict[str, Dict[str, str]]) -> None:
+    """Persist fetched creds with an expiry matching the AWS session lifetime."""
+    if not collected:
+        return
+    try:
+        COLLECTED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        COLLECTED_CACHE_PATH.write_text(
+            json.dumps({"expiry": time.time() + CRED_TTL_SECONDS, "collected": collected})
+        )
+        COLLECTED_CACHE_PATH.chmod(0o600)
+    except OSError as e:
+        print(f"⚠️  Could not cache credentials: {e}")
+ 
+ 
 def fetch_role_credentials(account: str, role: str, bearer_token: str) -> Dict[str, str]:
     """
     Call the SSO federation/credentials API to get session creds for an account/role.
     """
     url = API_URL_TEMPLATE.format(account=account, role=role)
     headers = {"Authorization": f"Bearer {bearer_token}"}
-    resp = requests.get(url, headers=headers, timeout=30)
+    resp = _HTTP.get(url, headers=headers, timeout=30)
     if resp.status_code != 200:
         raise RuntimeError(
             f"Failed for {account}/{role}: {resp.status_code} {resp.text}"
@@ -101,7 +139,7 @@ def get_signin_token(temp_creds: Dict[str, str]) -> str:
         "SessionType": "json",
         "Session": json.dumps(session_payload),
     }
-    r = requests.get("https://signin.aws.amazon.com/federation", params=params, timeout=30)
+    r = _HTTP.get("https://signin.aws.amazon.com/federation", params=params, timeout=30)
     if r.status_code != 200:
         raise RuntimeError(f"getSigninToken failed: {r.status_code} {r.text}")
     return r.json()["SigninToken"]
@@ -181,6 +219,7 @@ def account_menu(collected: Dict[str, Dict[str, str]], bearer_token: str) -> Opt
                 role = ACCOUNTS[acct_id]["role"]
                 print(f"🔐 Fetching credentials for {acct_id}/{role} ...")
                 collected[acct_id] = fetch_role_credentials(acct_id, role, bearer_token)
+                save_cached_creds(collected)
                 print("✅ Credentials ready.")
             except Exception as e:
                 print(f"❌ Could not fetch credentials: {e}")
@@ -205,18 +244,24 @@ def write_creds_flow(bearer_token: str) -> Dict[str, Dict[str, str]]:
     """
     collected: Dict[str, Dict[str, str]] = {}
     print("\n=== Writing credentials for all configured accounts ===")
-    for acct, meta in ACCOUNTS.items():
-        role = meta["role"]
-        name = meta["name"]
-        try:
-            print(f"🔐 {name} [{acct}] role={role} ... ", end="", flush=True)
-            creds = fetch_role_credentials(acct, role, bearer_token)
-            collected[acct] = creds
-            print("✅")
-        except Exception as e:
-            print(f"❌ {e}")
+    # Each fetch is an independent HTTPS GET against the pooled session, so
+    # the accounts come back in roughly the time of the slowest one.
+    with ThreadPoolExecutor(max_workers=min(16, len(ACCOUNTS))) as executor:
+        futures = {
+            executor.submit(fetch_role_credentials, acct, meta["role"], bearer_token): acct
+            for acct, meta in ACCOUNTS.items()
+        }
+        for future in as_completed(futures):
+            acct = futures[future]
+            meta = ACCOUNTS[acct]
+            try:
+                collected[acct] = future.result()
+                print(f"✅ {meta['name']} [{acct}] role={meta['role']}")
+            except Exception as e:
+                print(f"❌ {meta['name']} [{acct}] role={meta['role']}: {e}")
  
     if collected:
+        save_cached_creds(collected)
         try:
             write_credentials_file(collected, CREDENTIALS_PATH)
         except Exception as e:
@@ -242,7 +287,9 @@ def open_console_flow(bearer_token: str, collected: Optional[Dict[str, Dict[str,
 def main():
     try:
         bearer_token: Optional[str] = "eyJlbmMiOiJBMjU2R0NNIiwidGFnIjoiSUZxMms5Zjh6V1U0X1NoUyIsImFsZyI6IkEyNTZHQ01LVyIsIml2IjoiemQ4MUFOdDQ4YlVyUjRrQyJ9.AYABeJDotyUlY8SGoYpprEUkNyUAHwABABBEYXRhUGxhbmVTZXNzaW9uAAlQZXJlZ3JpbmUAAQAHYXdzLWttcwBLYXJuOmF3czprbXM6dXMtZWFzdC0xOjI3Njc4NzgzOTY5NjprZXkvNDYwM2MxMmQtNWYwYi00ZWI0LWI3YzktY2NiMDQ4OTEyYzI0ALgBAgEAeNp7IV1vTbu0bMh99b9cbjbHJCuztYZMXB0JYW2zKB6aAShmuCLnXF7ylLpxRpp6JW8AAAB-MHwGCSqGSIb3DQEHBqBvMG0CAQAwaAYJKoZIhvcNAQcBMB4GCWCGSAFlAwQBLjARBAxu7Qv0iLQhM1VXr2oCARCAO71PxvgcYIpNyzfQwwH05ZdnX77oPUvWjm5zEd8ng9GprOc2gArw1fldc-PK4-3FbsDMfmYzv_qpvRiDAgAAAAAMAAAQAAAAAAAAAAAAAAAAALE6heb5lPZ7ATqfQ88iVRD_____AAAAAQAAAAAAAAAAAAAAAQAAACBSr6j3bdMbABhUFmUEDc-0XbuXIxw6jel2wha56wP1jkBW7Pv4tmqPaUAX2ghWNbU.4DR8hK1BTP4w-3__.GJdeuavRgrOucqFviXsecWhJiHWuCG-jsnR-vAA2fWytvyjb0cxihi2-XH1zJ1Os-VGWvlnyfQQQozq6IMxhWeuYGFXDfdlAG_ehLR_TJ380eywqW0sUJJVcEUq2MIEu4LOYNeXm7pOUIibtDozSfIpJnp09tNyxLRN2690qpH9Tg1zwhMc9igp3RRX1YSmzxpqAXGcmNkyLiaPWromZ0lr1w3qBGFn3RP8AB0tw3T_Y2kvajmALxk5M1OV_dO9nLMscnWaXVcdknZ2Kqcj3h7FMx4ZYpMqc1FO5FYcVeP9tPoGSK4N-i6KvqPSJlcwd5F-4QrPC3aR9H2Sn2R4EVtr_cNKwXVyRCiDih4BkDl_7i1TvvFhr1Hn7L8V7-jxaqsLF08rG3bLI1dOYvzykr6NiJEVxHnRUZ-1fduHd2KvHWYnzW_xXfnE49jJXLHMx6OgcEuGecxEDFW6PfFN5_rWAloM7cFE4aHmpeFbJ4lUhKB9IkP8J_-4cLwglQCUzunG3tW1EX_Vk-FlhhGnFqzyGfvYsM2t-ybgYqPeN6pDHQ3QTQW40vVu69ipA9AkyPPkr4w98UjeOqKlD-m8HNePPsolOcLGVSmVcld0YUL1YbnL7IUPjbpBfmDSShNG1kpECuI9bhrr8LAOAHtgzEb4j8wsOQQlo61qe8p_DWo4whKBYPRYDme46Jt5OOj64d-elwgpOU8p8tVhvonZ0NtcYXES28kTfgMEghVxyatHZTF4g.0p_3czW3efWeZAC1YLr1Qg"
-        collected: Dict[str, Dict[str, str]] = {}
+        collected: Dict[str, Dict[str, str]] = load_cached_creds()
+        if collected:
+            print(f"♻️  Reusing cached credentials for {len(collected)} account(s).")
  
         while True:
             action = main_menu()
@@ -3,10 +3,10 @@
 import os
 import sys
 import argparse
+import threading
 import boto3
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 from modules.aws_session import AWSSession
 from modules.csv_handler import CSVHandler
 from modules.cluster_analyzer import ClusterAnalyzer
@@ -19,8 +19,9 @@ from modules.logger import Logger
 REGIONS_TO_SCAN = ['us-east-1', 'us-east-2', 'us-west-2', 'ap-south-1', 'eu-central-1']
 # IAM role to use for all accounts
 IAM_ROLE = 'PatchingAccess'
-# Number of parallel workers
-MAX_WORKERS = 15
+# Number of parallel workers: the scan is network-bound, so the sweet spot
+# tracks cpu_count()*5 rather than a fixed constant
+MAX_WORKERS = (os.cpu_count() or 4) * 5
 
 
 def parse_arguments():
@@ -59,56 +60,105 @@ Example:
                        type=int,
                        default=MAX_WORKERS,
                        help=f'Number of parallel workers (default: {MAX_WORKERS})')
+    parser.add_argument('--max-parallel-requests',
+                       type=int,
+                       default=None,
+                       help='Size of the boto3 connection pool (default: match --workers)')
+    parser.add_argument('--use-async',
+                       action='store_true',
+                       help='Drive the scan from an asyncio event loop via aioboto3 '
+                            '(falls back to the thread pool if aioboto3 is missing)')
     return parser.parse_args()
 
 
-def process_account_region(account_id, region, scan_num, total_scans, print_lock):
+def process_account_region(account_id, region, scan_num, total_scans):
     """Process a single account-region combination"""
     try:
-        with print_lock:
-            Logger.section(f"[{scan_num}/{total_scans}] Account {account_id} | Region {region}")
-            Logger.info(f"Starting analysis...")
+        # Logger pushes onto a queue drained by its own thread, so workers
+        # log freely without serializing on a shared print lock
+        Logger.section(f"[{scan_num}/{total_scans}] Account {account_id} | Region {region}")
+        Logger.info(f"Starting analysis...")
         
         aws_session = AWSSession(region, profile_name=account_id)
         
-        with print_lock:
-            aws_session.print_identity(account_id)
-            account_name = aws_session.get_account_name()
-            Logger.info(f"Account Name: {account_name}")
+        aws_session.print_identity(account_id)
+        account_name = aws_session.get_account_name()
+        Logger.info(f"Account Name: {account_name}")
         
         analyzer = ClusterAnalyzer(aws_session.session, region)
         
-        with print_lock:
-            Logger.info(f"Listing EKS clusters...")
+        Logger.info(f"Listing EKS clusters...")
         
         results = analyzer.analyze_clusters(account_id, account_name)
         
-        with print_lock:
-            if results:
-                Logger.success(f"✓ Collected {len(results)} record(s) from {account_id} ({region})")
-            else:
-                Logger.info(f"✓ No EKS clusters in {account_id} ({region})")
+        if results:
+            Logger.success(f"✓ Collected {len(results)} record(s) from {account_id} ({region})")
+        else:
+            Logger.info(f"✓ No EKS clusters in {account_id} ({region})")
         
         return {'success': True, 'results': results, 'account_id': account_id, 'region': region}
         
     except Exception as e:
         error_msg = str(e)
-        with print_lock:
-            Logger.error(f"✗ Failed: {account_id} in {region}")
-            Logger.error(f"Error: {error_msg[:150]}", indent=1)
-            
-            if "NoCredentialProviders" in error_msg or "InvalidClientTokenId" in error_msg:
-                Logger.error("SSO credentials expired", indent=1)
-            elif "AccessDenied" in error_msg:
-                Logger.error(f"No '{IAM_ROLE}' role access", indent=1)
-            elif "Timeout" in error_msg or "timed out" in error_msg.lower():
-                Logger.error("Operation timed out", indent=1)
+        Logger.error(f"✗ Failed: {account_id} in {region}")
+        Logger.error(f"Error: {error_msg[:150]}", indent=1)
+        
+        if "NoCredentialProviders" in error_msg or "InvalidClientTokenId" in error_msg:
+            Logger.error("SSO credentials expired", indent=1)
+        elif "AccessDenied" in error_msg:
+            Logger.error(f"No '{IAM_ROLE}' role access", indent=1)
+        elif "Timeout" in error_msg or "timed out" in error_msg.lower():
+            Logger.error("Operation timed out", indent=1)
         
         return {'success': False, 'results': [], 'account_id': account_id, 'region': region}
 
 
+def run_async_scan(tasks, workers):
+    """Run all scans from one event loop instead of a wide thread pool.
+
+    Most account-region pairs in a large org have zero EKS clusters, so the
+    event loop pre-screens each pair with a cheap async ListClusters through
+    aioboto3. Only pairs that actually have clusters (or whose pre-screen
+    errors out) fall through to the full blocking analyzer on a worker
+    thread. Hundreds of mostly-empty scans then cost coroutines, not
+    threads.
+    """
+    import asyncio
+    import aioboto3
+
+    async def scan_one(sem, account_id, region, scan_num, total_scans):
+        async with sem:
+            try:
+                session = aioboto3.Session(profile_name=account_id, region_name=region)
+                async with session.client("eks", region_name=region) as eks:
+                    clusters = []
+                    async for page in eks.get_paginator("list_clusters").paginate():
+                        clusters.extend(page.get("clusters", []))
+            except Exception:
+                # Let the sync worker redo the call and produce its usual
+                # diagnostics rather than duplicating them here
+                return await asyncio.to_thread(
+                    process_account_region, account_id, region, scan_num, total_scans
+                )
+            if not clusters:
+                Logger.info(f"[{scan_num}/{total_scans}] ✓ No EKS clusters in {account_id} ({region})")
+                return {'success': True, 'results': [], 'account_id': account_id, 'region': region}
+            return await asyncio.to_thread(
+                process_account_region, account_id, region, scan_num, total_scans
+            )
+
+    async def runner():
+        sem = asyncio.Semaphore(workers)
+        return await asyncio.gather(*[scan_one(sem, *task) for task in tasks])
+
+    return asyncio.run(runner())
+
+
 def main():
     args = parse_arguments()
+    # Size the urllib3 pool to the worker count up front so concurrent
+    # clients never queue on the default 10-connection pool
+    AWSSession.configure_pool(args.max_parallel_requests or args.workers)
     current_date = datetime.now().strftime("%Y_%m_%d")
     output_file = f"eks_analysis_output_{current_date}.csv"
     
@@ -165,11 +215,9 @@ def main():
     Logger.blank()
     
     # Step 5: Process All Account-Region Combinations in Parallel
-    all_results = []
     successful = 0
     failed = 0
     completed = 0
-    print_lock = Lock()
     
     # Build list of tasks
     tasks = []
@@ -182,72 +230,98 @@ def main():
     Logger.info(f"Starting parallel execution with {args.workers} workers...")
     Logger.blank()
     
-    # Execute tasks in parallel
-    with ThreadPoolExecutor(max_workers=args.workers) as executor:
-        # Submit all tasks
-        future_to_task = {
-            executor.submit(process_account_region, account_id, region, scan_num, total_scans, print_lock): (account_id, region)
-            for account_id, region, scan_num, total_scans in tasks
-        }
-        
-        # Process completed tasks as they finish
-        for future in as_completed(future_to_task):
-            result = future.result()
-            completed += 1
-            
-            if result['success']:
-                successful += 1
-                all_results.extend(result['results'])
-            else:
-                failed += 1
-            
-            # Print progress update every 10 completions
-            if completed % 10 == 0:
-                with print_lock:
+    if args.use_async:
+        try:
+            import aioboto3  # noqa: F401
+        except ImportError:
+            Logger.warning("aioboto3 not installed; falling back to thread pool")
+            args.use_async = False
+    
+    def result_stream():
+        # Yield rows straight from finished scans to the CSV writer so the
+        # full result set never has to accumulate in memory
+        nonlocal successful, failed, completed
+        if args.use_async:
+            for result in run_async_scan(tasks, args.workers):
+                completed += 1
+                if result['success']:
+                    successful += 1
+                else:
+                    failed += 1
+                yield from result['results']
+            return
+        # Execute tasks in parallel; map skips the futures dict and yields
+        # results in task order, keeping CSV rows grouped by account
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            for result in executor.map(lambda t: process_account_region(*t), tasks):
+                completed += 1
+
+                if result['success']:
+                    successful += 1
+                else:
+                    failed += 1
+
+                yield from result['results']
+
+                # Print progress update every 10 completions
+                if completed % 10 == 0:
                     Logger.blank()
                     Logger.info(f"Progress: {completed}/{total_scans} completed ({successful} successful, {failed} failed)")
                     Logger.blank()
-    
-    # Step 6: Write Results
+
+    # Step 6: Write Results (rows are streamed as workers finish)
+    records_written = csv_handler.write_cluster_data(output_file, result_stream())
+
     Logger.section("RESULTS SUMMARY")
     Logger.info(f"Total accounts scanned: {len(account_ids)}")
     Logger.info(f"Total regions per account: {len(REGIONS_TO_SCAN)}")
     Logger.info(f"Successful scans: {successful}/{total_scans}")
     Logger.info(f"Failed scans: {failed}/{total_scans}")
-    Logger.info(f"Total EKS records collected: {len(all_results)}")
-    
-    csv_handler.write_cluster_data(output_file, all_results)
+    Logger.info(f"Total EKS records collected: {records_written}")
     Logger.success(f"Report saved: {output_file}")
     
-    # Step 7: Upload to S3 (Optional)
-    if not args.skip_s3 and all_results:
+    # Step 7: Upload to S3 (Optional) — the transfer runs on a background
+    # thread so the SSO cache cleanup below overlaps the network time
+    upload_thread = None
+    upload_result = {}
+    if not args.skip_s3 and records_written:
         try:
             Logger.section("S3 UPLOAD")
             Logger.info(f"Uploading to account {args.s3_account}")
             
+            # Force the credential chain to resolve now: the SSO provider
+            # defers its cache read until the first request, which would
+            # otherwise land after the cleanup step deletes the cache while
+            # the upload is still running
             s3_session = AWSSession("us-east-1", profile_name=args.s3_account)
+            s3_session.session.get_credentials().get_frozen_credentials()
             s3_handler = S3Handler(s3_session.session)
             
-            success = s3_handler.upload_file(
-                local_file=output_file,
-                bucket=args.s3_bucket,
-                prefix=args.s3_prefix,
-                preserve_filename=True
-            )
+            def do_upload():
+                upload_result['success'] = s3_handler.upload_file(
+                    local_file=output_file,
+                    bucket=args.s3_bucket,
+                    prefix=args.s3_prefix,
+                    preserve_filename=True
+                )
             
-            if not success:
-                Logger.warning("S3 upload failed, but local file is available")
-                
+            upload_thread = threading.Thread(target=do_upload, name="s3-upload")
+            upload_thread.start()
         except Exception as e:
             Logger.error(f"S3 upload error: {e}")
             Logger.warning("Local file saved successfully despite S3 upload failure")
     elif args.skip_s3:
         Logger.info("Skipping S3 upload (--skip-s3 flag set)")
     
-    # Step 8: Cleanup
+    # Step 8: Cleanup (overlaps the upload)
     Logger.section("CLEANUP")
     SSOAuthenticator.cleanup_cache()
     
+    if upload_thread is not None:
+        upload_thread.join()
+        if not upload_result.get('success'):
+            Logger.warning("S3 upload failed, but local file is available")
+    
     Logger.blank()
     Logger.success("✓ Analysis Complete!")
     Logger.blank()
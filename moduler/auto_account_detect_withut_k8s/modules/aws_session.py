@@ -1,10 +1,19 @@
+import functools
+from types import MappingProxyType
 import boto3
+from botocore.config import Config
+from datetime import datetime, timezone
+from threading import Lock
 from typing import Dict, Optional
 from .logger import Logger
 
 
 class AWSSession:
     
+    # Shared client config; sized by configure_pool() so the connection pool
+    # matches the worker fan-out instead of the 10-connection default
+    CLIENT_CONFIG: Optional[Config] = None
+    
     # Static map of Account ID to Account Name
     # ACCOUNT_NAME_MAP = {
     #     "175504091457": "MMPay - QA",
@@ -113,14 +122,87 @@ class AWSSession:
         "780573890979": "mmfhir-sbx",
     }
     
+    # Int keys hash trivially in CPython (no SipHash pass over the 12-digit
+    # string) and the proxy freezes the public map against accidental writes
+    _ACCOUNT_NAME_MAP_INT = {int(k): v for k, v in ACCOUNT_NAME_MAP.items()}
+    ACCOUNT_NAME_MAP = MappingProxyType(ACCOUNT_NAME_MAP)
+    
+    
+    # Resolved credentials per profile: the five regional sessions of an
+    # account share one SSO credential fetch instead of paying it five times.
+    _CRED_CACHE: Dict[str, tuple] = {}
+    _CRED_LOCK = Lock()
+    # One boto3.Session per profile, shared across regions — clients carry
+    # their own region_name, so the regional scans of an account reuse the
+    # same session (and its refreshing credential chain) instead of
+    # building five.
+    _SESSION_CACHE: Dict[str, boto3.Session] = {}
+    _SESSION_LOCK = Lock()
+    # Refresh this long before the cached credentials actually expire
+    CRED_REFRESH_MARGIN_SECONDS = 300
+    
+    @classmethod
+    def configure_pool(cls, max_parallel_requests: int):
+        # Adaptive retry mode client-side rate-limits around throttling
+        # instead of letting a wide fan-out slam into RequestLimitExceeded
+        cls.CLIENT_CONFIG = Config(
+            max_pool_connections=max_parallel_requests,
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+        )
+    
+    @classmethod
+    def _cached_credentials(cls, profile_name: str):
+        with cls._CRED_LOCK:
+            entry = cls._CRED_CACHE.get(profile_name)
+        if not entry:
+            return None
+        creds, expiry = entry
+        remaining = (expiry - datetime.now(timezone.utc)).total_seconds()
+        if remaining < cls.CRED_REFRESH_MARGIN_SECONDS:
+            return None
+        return creds
+    
+    @classmethod
+    def _store_credentials(cls, profile_name: str, session: boto3.Session):
+        base = session.get_credentials()
+        if base is None:
+            return
+        expiry = getattr(base, "_expiry_time", None)
+        if expiry is None:
+            # Non-expiring or unknown lifetime; not worth caching blind
+            return
+        frozen = base.get_frozen_credentials()
+        with cls._CRED_LOCK:
+            cls._CRED_CACHE[profile_name] = (frozen, expiry)
+    
+    # STS identity per profile, shared across instances: the same account
+    # scanned in several regions answers get_caller_identity once
+    _IDENTITY_CACHE: Dict[str, Dict[str, str]] = {}
+    _IDENTITY_LOCK = Lock()
+    
     def __init__(self, region: str, profile_name: Optional[str] = None):
         self.region = region
         self.profile_name = profile_name
-        self._identity_cache = None
-        self._account_name_cache = None
         try:
             if profile_name:
-                self.session = boto3.Session(profile_name=profile_name, region_name=region)
+                with self._SESSION_LOCK:
+                    session = self._SESSION_CACHE.get(profile_name)
+                    if session is None:
+                        cached = self._cached_credentials(profile_name)
+                        if cached is not None:
+                            session = boto3.Session(
+                                aws_access_key_id=cached.access_key,
+                                aws_secret_access_key=cached.secret_key,
+                                aws_session_token=cached.token,
+                                region_name=region,
+                            )
+                        else:
+                            session = boto3.Session(profile_name=profile_name, region_name=region)
+                            self._store_credentials(profile_name, session)
+                            # Only profile-backed sessions refresh their own
+                            # credentials, so only those are safe to keep
+                            self._SESSION_CACHE[profile_name] = session
+                self.session = session
             else:
                 self.session = boto3.Session(region_name=region)
         except Exception as e:
@@ -128,27 +210,36 @@ class AWSSession:
             raise
     
     def get_caller_identity(self) -> Dict[str, str]:
-        if self._identity_cache:
-            return self._identity_cache
+        key = getattr(self, "profile_name", None) or "__default__"
+        with self._IDENTITY_LOCK:
+            cached = self._IDENTITY_CACHE.get(key)
+        if cached:
+            return cached
         try:
-            sts = self.session.client("sts", region_name=self.region)
-            self._identity_cache = sts.get_caller_identity()
-            return self._identity_cache
+            sts = self.session.client("sts", region_name=self.region, config=self.CLIENT_CONFIG)
+            identity = sts.get_caller_identity()
+            with self._IDENTITY_LOCK:
+                self._IDENTITY_CACHE[key] = identity
+            return identity
         except Exception as e:
             Logger.error(f"Failed to get caller identity: {e}")
             Logger.error("This usually means authentication failed or credentials expired", indent=1)
             raise
     
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _lookup_name(account_id: str) -> str:
+        # Look up account name from static map, default to account ID if not
+        # found; lru_cache shares the resolution across all instances
+        try:
+            key = int(account_id)
+        except (TypeError, ValueError):
+            return account_id
+        return AWSSession._ACCOUNT_NAME_MAP_INT.get(key, account_id)
+    
     def get_account_name(self) -> str:
-        if self._account_name_cache:
-            return self._account_name_cache
-        
         identity = self.get_caller_identity()
-        account_id = identity["Account"]
-        
-        # Look up account name from static map, default to account ID if not found
-        self._account_name_cache = self.ACCOUNT_NAME_MAP.get(account_id, account_id)
-        return self._account_name_cache
+        return self._lookup_name(identity["Account"])
     
     def print_identity(self, account_id: str):
         try:
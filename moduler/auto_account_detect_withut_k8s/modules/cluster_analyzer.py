@@ -1,8 +1,13 @@
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple
 from .eks_operations import EKSOperations
 from .node_operations import NodeOperations
 from .logger import Logger
 
+# Shared across analyzer instances so each account/region does not pay
+# thread startup again; sized for the describe fan-out within one region
+_CLUSTER_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="cluster")
+
 
 class ClusterAnalyzer:
     
@@ -20,7 +25,7 @@ class ClusterAnalyzer:
         self.node_ops = NodeOperations(session, region)
         # Kubernetes operations removed - requires cluster authentication access
     
-    def analyze_clusters(self, account_id: str, account_name: str = None) -> List[Dict[str, Any]]:
+    def analyze_clusters(self, account_id: str, account_name: str = None) -> List[Tuple]:
         if account_name is None:
             account_name = account_id
         
@@ -32,24 +37,28 @@ class ClusterAnalyzer:
         
         Logger.success(f"Found {len(clusters)} cluster(s)")
         Logger.info(f"Clusters: {', '.join(clusters)}", indent=1)
-        results = []
         
-        for cluster_name in clusters:
+        def analyze_one(cluster_name):
             Logger.subsection(f"Analyzing cluster: {cluster_name}")
             try:
-                cluster_results = self._analyze_single_cluster(account_id, account_name, cluster_name)
-                results.extend(cluster_results)
+                return self._analyze_single_cluster(account_id, account_name, cluster_name)
             except Exception as e:
                 Logger.error(f"Error analyzing cluster {cluster_name}: {str(e)[:100]}", indent=1)
                 # Still add cluster to results even if analysis fails
                 cluster_version = self.eks_ops.get_cluster_version(cluster_name)
                 latest_version = self.eks_ops.get_latest_supported_version()
-                results.append(self._create_empty_row(account_id, account_name, cluster_name, 
-                                                     cluster_version, latest_version))
+                return [self._create_empty_row(account_id, account_name, cluster_name, 
+                                               cluster_version, latest_version)]
+        
+        # Fan the describe/SSM/EC2 latency of the clusters out in parallel;
+        # region time drops to roughly the slowest cluster
+        results = []
+        for cluster_results in _CLUSTER_EXECUTOR.map(analyze_one, clusters):
+            results.extend(cluster_results)
         
         return results
     
-    def _analyze_single_cluster(self, account_id: str, account_name: str, cluster_name: str) -> List[Dict[str, Any]]:
+    def _analyze_single_cluster(self, account_id: str, account_name: str, cluster_name: str) -> List[Tuple]:
         try:
             cluster_version = self.eks_ops.get_cluster_version(cluster_name)
             Logger.info(f"Version: {cluster_version}", indent=1)
@@ -98,7 +107,7 @@ class ClusterAnalyzer:
                                           cluster_version, latest_version)]
     
     def _process_node(self, account_id: str, account_name: str, cluster_name: str, cluster_version: str,
-                     node: Dict, latest_amis: Dict, readiness_map: Dict, latest_supported_version: str) -> Dict[str, Any]:
+                     node: Dict, latest_amis: Dict, readiness_map: Dict, latest_supported_version: str) -> Tuple:
         try:
             os_version = node.get("OS_Version", "Unknown")
             os_key = self.OS_MAPPING.get(os_version)
@@ -120,53 +129,53 @@ class ClusterAnalyzer:
             
             instance_id = node.get("InstanceID", "N/A")
             compliance = self.eks_ops.check_cluster_compliance(cluster_version, latest_supported_version)
-            
-            return {
-                "AccountID": account_id,
-                "AccountName": account_name,
-                "Region": self.region,
-                "ClusterName": cluster_name,
-                "ClusterVersion": cluster_version,
-                "InstanceID": instance_id,
-                "Current_AMI_ID": node.get("Current_AMI_ID", "N/A"),
-                "Current_AMI_Publication_Date": node.get("Current_AMI_Publication_Date", "N/A"),
-                "AMI_Age(in days)": node.get("AMI_Age", "N/A"),
-                "OS_Version": os_version,
-                "InstanceType": node.get("InstanceType", "N/A"),
-                "NodeState": node.get("NodeState", "N/A"),
-                "NodeUptime": node.get("NodeUptime", "N/A"),
-                "Latest_AMI_ID": latest_ami_id,
-                "New_AMI_Publication_Date": new_ami_publication_date,
-                "PatchPendingStatus": self.node_ops.get_patch_status(node.get("AMI_Age", "N/A")),
-                "NodeReadinessStatus": readiness_map.get(instance_id, "Unknown"),
-                "Cluster_Compliance": compliance
-            }
+
+            # Positional tuple in CSVHandler.HEADERS order (minus the
+            # timestamp the writer appends) — cheaper than a dict per node
+            return (
+                account_id,
+                account_name,
+                self.region,
+                cluster_name,
+                cluster_version,
+                instance_id,
+                node.get("Current_AMI_ID", "N/A"),
+                node.get("Current_AMI_Publication_Date", "N/A"),
+                node.get("AMI_Age", "N/A"),
+                os_version,
+                node.get("InstanceType", "N/A"),
+                node.get("NodeState", "N/A"),
+                node.get("NodeUptime", "N/A"),
+                latest_ami_id,
+                new_ami_publication_date,
+                self.node_ops.get_patch_status(node.get("AMI_Age_Days")),
+                readiness_map.get(instance_id, "Unknown"),
+                compliance
+            )
         except Exception as e:
             Logger.warning(f"Error processing node data: {e}", indent=2)
-            return self._create_empty_row(account_id, account_name, cluster_name, cluster_version)
+            return self._create_empty_row(account_id, account_name, cluster_name, cluster_version,
+                                          latest_supported_version)
     
     def _create_empty_row(self, account_id: str, account_name: str, cluster_name: str, 
-                         cluster_version: str, latest_supported_version: str) -> Dict[str, Any]:
-        base_data = {
-            "AccountID": account_id,
-            "AccountName": account_name,
-            "Region": self.region,
-            "ClusterName": cluster_name,
-            "ClusterVersion": cluster_version
-        }
-        empty_fields = dict.fromkeys([
-            "InstanceID", "Current_AMI_ID", "Current_AMI_Publication_Date", "AMI_Age(in days)", 
-            "OS_Version", "InstanceType", "NodeState", "NodeUptime", 
-            "Latest_AMI_ID", "New_AMI_Publication_Date", "PatchPendingStatus",
-            "NodeReadinessStatus"
-        ], "N/A")
-        
-        # Set AMI_Age to 0 for clusters with no nodes
-        empty_fields["AMI_Age(in days)"] = "0"
-        # Set PatchPendingStatus to 0 for clusters with no nodes
-        empty_fields["PatchPendingStatus"] = "0"
-        
+                         cluster_version: str, latest_supported_version: str) -> Tuple:
+        base_data = (account_id, account_name, self.region, cluster_name, cluster_version)
         compliance = self.eks_ops.check_cluster_compliance(cluster_version, latest_supported_version)
-        empty_fields["Cluster_Compliance"] = compliance
-        
-        return {**base_data, **empty_fields}
+
+        # Same positional layout as _process_node; AMI_Age and
+        # PatchPendingStatus stay "0" for clusters with no nodes
+        return base_data + (
+            "N/A",   # InstanceID
+            "N/A",   # Current_AMI_ID
+            "N/A",   # Current_AMI_Publication_Date
+            "0",     # AMI_Age(in days)
+            "N/A",   # OS_Version
+            "N/A",   # InstanceType
+            "N/A",   # NodeState
+            "N/A",   # NodeUptime
+            "N/A",   # Latest_AMI_ID
+            "N/A",   # New_AMI_Publication_Date
+            "0",     # PatchPendingStatus
+            "N/A",   # NodeReadinessStatus
+            compliance
+        )
@@ -1,35 +1,42 @@
 import csv
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Iterable, Tuple
 from .logger import Logger
 
 
 class CSVHandler:
-    
+
     HEADERS = [
         "AccountID", "AccountName", "Region", "ClusterName", "ClusterVersion",
-        "InstanceID", "Current_AMI_ID", "Current_AMI_Publication_Date", "AMI_Age(in days)", 
-        "OS_Version", "InstanceType", "NodeState", "NodeUptime", 
+        "InstanceID", "Current_AMI_ID", "Current_AMI_Publication_Date", "AMI_Age(in days)",
+        "OS_Version", "InstanceType", "NodeState", "NodeUptime",
         "Latest_AMI_ID", "New_AMI_Publication_Date", "PatchPendingStatus",
         "NodeReadinessStatus", "Cluster_Compliance", "Audit_Timestamp"
     ]
-    
+
     @staticmethod
-    def write_cluster_data(output_file: str, data: List[Dict[str, Any]]):
-        if not data:
-            Logger.warning("No data to write")
-            return
-        
-        # Add current date as Audit_Timestamp to each row
+    def write_cluster_data(output_file: str, rows: Iterable[Tuple]) -> int:
+        """Stream rows to disk as they arrive and return how many were written.
+
+        Rows are positional tuples in HEADERS order (ClusterAnalyzer builds
+        them that way), minus the audit timestamp which is appended here.
+        Accepts any iterable — typically a generator fed from completed
+        workers — so the full result set never has to sit in memory.
+        """
         current_date = datetime.now().strftime("%d/%m/%y")
-        for row in data:
-            row["Audit_Timestamp"] = current_date
-        
+        written = 0
         try:
-            with open(output_file, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=CSVHandler.HEADERS)
-                writer.writeheader()
-                writer.writerows(data)
-            Logger.success(f"Results written to {output_file}")
+            # Large write buffer so streamed rows flush in few syscalls
+            with open(output_file, 'w', newline='', buffering=4 * 1024 * 1024) as f:
+                writer = csv.writer(f)
+                writer.writerow(CSVHandler.HEADERS)
+                for row in rows:
+                    writer.writerow(tuple(row) + (current_date,))
+                    written += 1
+            if written:
+                Logger.success(f"Results written to {output_file}")
+            else:
+                Logger.warning("No data to write")
         except Exception as e:
             Logger.error(f"Failed to write CSV: {e}")
+        return written
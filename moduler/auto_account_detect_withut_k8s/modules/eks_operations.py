@@ -1,5 +1,6 @@
 from typing import List, Dict, Tuple
 from botocore.exceptions import ClientError
+from .aws_session import AWSSession
 from .logger import Logger
 
 
@@ -15,9 +16,9 @@ class EKSOperations:
     def __init__(self, session, region: str):
         self.session = session
         self.region = region
-        self.eks_client = session.client("eks", region_name=region)
-        self.ssm_client = session.client("ssm", region_name=region)
-        self.ec2_client = session.client("ec2", region_name=region)
+        self.eks_client = session.client("eks", region_name=region, config=AWSSession.CLIENT_CONFIG)
+        self.ssm_client = session.client("ssm", region_name=region, config=AWSSession.CLIENT_CONFIG)
+        self.ec2_client = session.client("ec2", region_name=region, config=AWSSession.CLIENT_CONFIG)
     
     def list_clusters(self) -> List[str]:
         try:
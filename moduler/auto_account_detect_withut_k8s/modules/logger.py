@@ -1,6 +1,33 @@
+import atexit
+import queue
+import threading
 from datetime import datetime
 from typing import Optional
 
+# All log output funnels through one queue drained by a single daemon
+# thread: workers enqueue pre-formatted strings and never block on the
+# terminal, so no print lock is needed anywhere.
+_LOG_QUEUE = queue.SimpleQueue()
+
+
+def _drain_log_queue():
+    while True:
+        print(_LOG_QUEUE.get())
+
+
+_LOG_THREAD = threading.Thread(target=_drain_log_queue, daemon=True, name="logger")
+_LOG_THREAD.start()
+
+
+@atexit.register
+def _flush_log_queue():
+    # The drain thread is a daemon; print whatever it had not reached yet
+    try:
+        while True:
+            print(_LOG_QUEUE.get_nowait())
+    except queue.Empty:
+        pass
+
 
 class Logger:
     
@@ -26,67 +53,91 @@ class Logger:
         'DEBUG': {'color': 'GRAY', 'symbol': '○'}
     }
     
+    # Indent levels used in practice are small; interning the strings once
+    # avoids rebuilding '  ' * indent on every log call
+    _INDENTS = tuple('  ' * i for i in range(16))
+    
+    # Composed ANSI sequences for the border helpers, built once instead of
+    # two dict lookups and a concat per bordered line
+    _CYAN_BOLD = COLORS['CYAN'] + COLORS['BOLD']
+    _MAGENTA_BOLD = COLORS['MAGENTA'] + COLORS['BOLD']
+    _GRAY = COLORS['GRAY']
+    _RESET = COLORS['RESET']
+    
     @classmethod
     def _format_message(cls, level: str, message: str, indent: int = 0) -> str:
-        config = cls.LEVEL_CONFIG.get(level, {'color': 'WHITE', 'symbol': '•'})
-        color = cls.COLORS.get(config['color'], '')
-        symbol = config['symbol']
-        reset = cls.COLORS['RESET']
-        bold = cls.COLORS['BOLD']
-        
-        indent_str = '  ' * indent
-        level_str = f"{color}{bold}{level:<8}{reset}"
-        symbol_str = f"{color}{symbol}{reset}"
-        
-        return f"{indent_str}{symbol_str} {level_str} {message}"
+        prefix = cls._PREFIX.get(level)
+        if prefix is None:
+            color = cls.COLORS['WHITE']
+            prefix = f"{color}•{cls.COLORS['RESET']} {color}{cls.COLORS['BOLD']}{level:<8}{cls.COLORS['RESET']}"
+        try:
+            indent_str = cls._INDENTS[indent]
+        except IndexError:
+            indent_str = '  ' * indent
+        return f"{indent_str}{prefix} {message}"
+    
+    @staticmethod
+    def _emit(text: str):
+        _LOG_QUEUE.put(text)
     
     @classmethod
     def info(cls, message: str, indent: int = 0):
-        print(cls._format_message('INFO', message, indent))
+        cls._emit(cls._format_message('INFO', message, indent))
     
     @classmethod
     def success(cls, message: str, indent: int = 0):
-        print(cls._format_message('SUCCESS', message, indent))
+        cls._emit(cls._format_message('SUCCESS', message, indent))
     
     @classmethod
     def warning(cls, message: str, indent: int = 0):
-        print(cls._format_message('WARNING', message, indent))
+        cls._emit(cls._format_message('WARNING', message, indent))
     
     @classmethod
     def error(cls, message: str, indent: int = 0):
-        print(cls._format_message('ERROR', message, indent))
+        cls._emit(cls._format_message('ERROR', message, indent))
     
     @classmethod
     def critical(cls, message: str, indent: int = 0):
-        print(cls._format_message('CRITICAL', message, indent))
+        cls._emit(cls._format_message('CRITICAL', message, indent))
     
     @classmethod
     def debug(cls, message: str, indent: int = 0):
-        print(cls._format_message('DEBUG', message, indent))
+        cls._emit(cls._format_message('DEBUG', message, indent))
     
     @classmethod
     def header(cls, title: str, width: int = 100, char: str = '='):
         border = char * width
-        print(f"\n{cls.COLORS['CYAN']}{cls.COLORS['BOLD']}{border}{cls.COLORS['RESET']}")
-        print(f"{cls.COLORS['CYAN']}{cls.COLORS['BOLD']}{title.center(width)}{cls.COLORS['RESET']}")
-        print(f"{cls.COLORS['CYAN']}{cls.COLORS['BOLD']}{border}{cls.COLORS['RESET']}\n")
+        # Multi-line output goes up as one queue item so concurrent workers
+        # cannot interleave inside it
+        cls._emit(f"\n{cls._CYAN_BOLD}{border}{cls._RESET}\n"
+                  f"{cls._CYAN_BOLD}{title.center(width)}{cls._RESET}\n"
+                  f"{cls._CYAN_BOLD}{border}{cls._RESET}\n")
     
     @classmethod
     def section(cls, title: str, width: int = 100, char: str = '='):
         border = char * width
-        print(f"\n{cls.COLORS['MAGENTA']}{cls.COLORS['BOLD']}{border}{cls.COLORS['RESET']}")
-        print(f"{cls.COLORS['MAGENTA']}{cls.COLORS['BOLD']}{title}{cls.COLORS['RESET']}")
-        print(f"{cls.COLORS['MAGENTA']}{cls.COLORS['BOLD']}{border}{cls.COLORS['RESET']}")
+        cls._emit(f"\n{cls._MAGENTA_BOLD}{border}{cls._RESET}\n"
+                  f"{cls._MAGENTA_BOLD}{title}{cls._RESET}\n"
+                  f"{cls._MAGENTA_BOLD}{border}{cls._RESET}")
     
     @classmethod
     def subsection(cls, title: str, indent: int = 0):
-        indent_str = '  ' * indent
-        print(f"\n{indent_str}{cls.COLORS['CYAN']}{cls.COLORS['BOLD']}▸ {title}{cls.COLORS['RESET']}")
+        indent_str = cls._INDENTS[indent] if indent < len(cls._INDENTS) else '  ' * indent
+        cls._emit(f"\n{indent_str}{cls._CYAN_BOLD}▸ {title}{cls._RESET}")
     
     @classmethod
     def separator(cls, width: int = 100, char: str = '-'):
-        print(f"{cls.COLORS['GRAY']}{char * width}{cls.COLORS['RESET']}")
+        cls._emit(f"{cls._GRAY}{char * width}{cls._RESET}")
     
     @classmethod
     def blank(cls):
-        print()
+        cls._emit("")
+
+
+# The symbol/level prefix of a line is fixed per level; building it once here
+# saves the dict lookups and string concatenations on every log call
+Logger._PREFIX = {
+    level: (f"{Logger.COLORS[cfg['color']]}{cfg['symbol']}{Logger.COLORS['RESET']} "
+            f"{Logger.COLORS[cfg['color']]}{Logger.COLORS['BOLD']}{level:<8}{Logger.COLORS['RESET']}")
+    for level, cfg in Logger.LEVEL_CONFIG.items()
+}
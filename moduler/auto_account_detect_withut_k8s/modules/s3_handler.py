@@ -1,4 +1,5 @@
 import boto3
+from boto3.s3.transfer import TransferConfig
 from datetime import datetime
 from pathlib import Path
 from botocore.exceptions import ClientError
@@ -7,6 +8,13 @@ from .logger import Logger
 
 class S3Handler:
     
+    # Multipart kicks in at 8 MiB and uploads parts on 10 threads, so big
+    # reports do not crawl up a single connection
+    TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        max_concurrency=10,
+    )
+    
     def __init__(self, session):
         self.session = session
         self.s3_client = session.client("s3")
@@ -37,7 +45,8 @@ class S3Handler:
             self.s3_client.upload_file(
                 Filename=local_file,
                 Bucket=bucket,
-                Key=s3_key
+                Key=s3_key,
+                Config=self.TRANSFER_CONFIG
             )
             
             s3_url = f"s3://{bucket}/{s3_key}"
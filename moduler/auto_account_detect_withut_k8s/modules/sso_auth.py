@@ -1,7 +1,18 @@
+import configparser
 import os
 import shutil
 import subprocess
 import boto3
+
+# Optional fast JSON parser; the SSO cache files are tiny individually but
+# the directory can hold one per login, so a faster loads() is free speed
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
@@ -17,24 +28,59 @@ class SSOAuthenticator:
     CACHE_PATH = Path.home() / ".aws" / "sso" / "cache"
     LOGIN_TIMEOUT = 300
     
+    BACKUPS_TO_KEEP = 5
+    
     @staticmethod
     def backup_config():
         if SSOAuthenticator.CONFIG_PATH.exists():
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = SSOAuthenticator.CONFIG_PATH.with_suffix(f".backup_{timestamp}")
-            backup_path.write_text(SSOAuthenticator.CONFIG_PATH.read_text())
+            # copyfile streams in chunks instead of decoding/re-encoding
+            # the whole file through Python strings
+            shutil.copyfile(SSOAuthenticator.CONFIG_PATH, backup_path)
             Logger.info(f"Backed up AWS config to {backup_path}")
+            SSOAuthenticator._prune_backups()
     
+    @staticmethod
+    def _prune_backups():
+        # Timestamped names sort chronologically; drop everything but the
+        # newest few so repeated runs don't litter ~/.aws
+        backups = sorted(SSOAuthenticator.CONFIG_PATH.parent.glob("config.backup_*"))
+        for stale in backups[:-SSOAuthenticator.BACKUPS_TO_KEEP]:
+            try:
+                stale.unlink()
+            except OSError as e:
+                Logger.warning(f"Could not remove old backup {stale.name}: {e}")
+    
+    @staticmethod
+    def _existing_profile_names() -> set:
+        """Parse the AWS config once and return its profile names as a set."""
+        if not SSOAuthenticator.CONFIG_PATH.exists():
+            return set()
+        parser = configparser.ConfigParser(strict=False)
+        try:
+            parser.read(SSOAuthenticator.CONFIG_PATH)
+        except configparser.Error as e:
+            Logger.warning(f"Could not parse AWS config: {e}")
+            return set()
+        profiles = set()
+        for section in parser.sections():
+            if section.startswith("profile "):
+                profiles.add(section[len("profile "):])
+            else:
+                profiles.add(section)
+        return profiles
+
     @staticmethod
     def setup_profiles(accounts_data: Dict[str, str]):
-        SSOAuthenticator.backup_config()
-        
-        existing_content = SSOAuthenticator.CONFIG_PATH.read_text() if SSOAuthenticator.CONFIG_PATH.exists() else ""
-        
+        # One configparser pass instead of a substring scan of the whole
+        # file per account; membership checks are O(1) against the set
+        existing_profiles = SSOAuthenticator._existing_profile_names()
+
         config_lines = []
         profiles_to_add = 0
         for account_id, role_name in accounts_data.items():
-            if f"[profile {account_id}]" not in existing_content:
+            if account_id not in existing_profiles:
                 profiles_to_add += 1
                 config_lines.extend([
                     f"[profile {account_id}]",
@@ -47,9 +93,18 @@ class SSOAuthenticator:
                 ])
         
         if config_lines:
+            # Only snapshot the config when we are actually about to touch it
+            SSOAuthenticator.backup_config()
             SSOAuthenticator.CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with SSOAuthenticator.CONFIG_PATH.open("a") as f:
-                f.write("\n" + "\n".join(config_lines))
+            # One encoded write through a raw append fd — the whole block
+            # lands in a single atomic-ish write and new files get 0600
+            payload = ("\n" + "\n".join(config_lines)).encode()
+            fd = os.open(SSOAuthenticator.CONFIG_PATH,
+                         os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
             Logger.success(f"Added {profiles_to_add} SSO profile(s) to AWS config")
         else:
             Logger.info("All SSO profiles already exist in AWS config")
@@ -125,55 +180,62 @@ class SSOAuthenticator:
             Logger.warning(f"Failed to clean up SSO cache: {e}")
             return False
     
+    @staticmethod
+    def _sso_access_token() -> str:
+        """Read the SSO access token the CLI login left in the cache."""
+        if not SSOAuthenticator.CACHE_PATH.exists():
+            return ""
+        for cache_file in SSOAuthenticator.CACHE_PATH.glob("*.json"):
+            try:
+                cached = _json.loads(cache_file.read_bytes())
+            except (ValueError, OSError):
+                continue
+            token = cached.get("accessToken")
+            start_url = cached.get("startUrl", "")
+            if token and start_url.rstrip("/#") in SSOAuthenticator.SSO_START_URL:
+                return token
+        return ""
+
     @staticmethod
     def discover_accounts() -> List[str]:
         """
         Discover all AWS accounts accessible via the current SSO session.
-        Uses AWS CLI to list accounts from SSO (no Organizations API needed).
-        Returns a list of account IDs.
+        Calls the SSO API in-process with the cached login token instead
+        of shelling out to the AWS CLI. Returns a list of account IDs.
         """
         try:
             Logger.info("Discovering accessible AWS accounts from SSO...")
-            
-            # Use AWS CLI to list accounts accessible via SSO
-            result = subprocess.run(
-                ["aws", "sso", "list-accounts"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode != 0:
-                Logger.error("Failed to list SSO accounts")
-                Logger.error(f"Error: {result.stderr.strip()}", indent=1)
+
+            access_token = SSOAuthenticator._sso_access_token()
+            if not access_token:
+                Logger.error("No SSO access token found in cache")
                 Logger.blank()
                 Logger.info("Falling back to parsing AWS config profiles...", indent=1)
                 return SSOAuthenticator._discover_from_config()
-            
-            # Parse JSON output
-            import json
-            accounts_data = json.loads(result.stdout)
-            
+
+            sso = boto3.client("sso", region_name=SSOAuthenticator.SSO_REGION)
+
             account_ids = []
-            for account in accounts_data:
-                account_id = account.get('accountId')
-                account_name = account.get('accountName', 'N/A')
-                if account_id:
-                    account_ids.append(account_id)
-                    Logger.info(f"  • {account_id} ({account_name})", indent=1)
-            
+            paginator = sso.get_paginator("list_accounts")
+            for page in paginator.paginate(accessToken=access_token):
+                for account in page.get("accountList", []):
+                    account_id = account.get('accountId')
+                    account_name = account.get('accountName', 'N/A')
+                    if account_id:
+                        account_ids.append(account_id)
+                        Logger.info(f"  • {account_id} ({account_name})", indent=1)
+
             if account_ids:
                 Logger.success(f"Discovered {len(account_ids)} account(s) from SSO")
                 return account_ids
             else:
                 Logger.warning("No accounts found via SSO")
                 return []
-                
-        except FileNotFoundError:
-            Logger.error("AWS CLI not found")
-            return []
-        except json.JSONDecodeError:
-            Logger.warning("Failed to parse SSO accounts, trying config fallback...")
+
+        except ClientError as e:
+            Logger.error(f"Failed to list SSO accounts: {e}")
+            Logger.blank()
+            Logger.info("Falling back to parsing AWS config profiles...", indent=1)
             return SSOAuthenticator._discover_from_config()
         except Exception as e:
             Logger.error(f"Unexpected error discovering accounts: {e}")
@@ -188,17 +250,19 @@ class SSOAuthenticator:
         account_ids = []
         try:
             if SSOAuthenticator.CONFIG_PATH.exists():
-                config_content = SSOAuthenticator.CONFIG_PATH.read_text()
-                lines = config_content.split('\n')
-                
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith('sso_account_id'):
-                        account_id = line.split('=')[1].strip()
-                        if account_id and account_id not in account_ids:
-                            account_ids.append(account_id)
-                            Logger.info(f"  • {account_id} (from config)", indent=1)
-                
+                # configparser handles inline comments and spacing that the
+                # old line scanner tripped over; the set keeps dedup O(1)
+                parser = configparser.ConfigParser(strict=False)
+                parser.read(SSOAuthenticator.CONFIG_PATH)
+
+                seen = set()
+                for section in parser.sections():
+                    account_id = parser.get(section, 'sso_account_id', fallback='').strip()
+                    if account_id and account_id not in seen:
+                        seen.add(account_id)
+                        account_ids.append(account_id)
+                        Logger.info(f"  • {account_id} (from config)", indent=1)
+
                 if account_ids:
                     Logger.success(f"Found {len(account_ids)} account(s) from AWS config")
                     return account_ids
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""Shared entrypoint for the analyzer variants.
+
+The main/, withut_k8s/, workspace_test/ and github_actions_withut_k8s/
+copies of eks_analyzer.py were ~90% identical and drifted every time a fix
+landed in one of them. Each variant directory now keeps its own modules/
+package plus a small eks_analyzer.py shim that puts this file on sys.path
+and calls main() with its flags; the argument parsing, account fan-out,
+finalize and upload logic live here once.
+
+The `modules` package is deliberately resolved against the shim's
+directory (the script dir stays on sys.path), so every variant keeps its
+own AWSSession/ClusterAnalyzer behavior.
+"""
+
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+# Only the light modules load up front; AWSSession, ClusterAnalyzer and
+# S3Handler drag in boto3 (~300ms of endpoint-data parsing) and are
+# imported inside run() once the early-exit checks have passed, so
+# --help and a missing accounts.csv never pay for them
+from modules.csv_handler import CSVHandler
+from modules.logger import Logger
+
+
+def parse_arguments(description, s3_bucket, s3_prefix, s3_account=None, account_list_arg=False):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--s3-bucket',
+                       default=s3_bucket,
+                       help=f'S3 bucket name for output upload (default: {s3_bucket})')
+    parser.add_argument('--s3-prefix',
+                       default=s3_prefix,
+                       help=f'S3 prefix/folder for output upload (default: {s3_prefix})')
+    if s3_account:
+        parser.add_argument('--s3-account',
+                           default=s3_account,
+                           help=f'AWS account ID where S3 bucket is located (default: {s3_account})')
+    parser.add_argument('--skip-s3',
+                       action='store_true',
+                       help='Skip S3 upload and only save locally')
+    if account_list_arg:
+        parser.add_argument('--account-list',
+                           default='accounts.csv',
+                           help='CSV file with account list (default: accounts.csv)')
+    return parser.parse_args()
+
+
+def run(*, auth='sso', header='EKS CLUSTER ANALYZER (SSO)',
+        description='EKS Cluster Analyzer with SSO Authentication',
+        s3_bucket='vignesh-s3-debezium-test', s3_prefix='reports',
+        s3_account=None, s3_upload='first-account',
+        dated_output=True, account_list_arg=False):
+    """Run one analyzer variant.
+
+    auth: 'sso' (profile per account) or 'role' (RoleAssumption, e.g.
+    GitHub Actions OIDC). s3_upload: 'first-account' reuses the first
+    listed account's session, 's3-account' logs into a dedicated profile,
+    'role' assumes the upload role through the role assumer.
+    """
+    args = parse_arguments(description, s3_bucket, s3_prefix, s3_account, account_list_arg)
+    csv_file = getattr(args, 'account_list', 'accounts.csv')
+    if dated_output:
+        current_date = datetime.now().strftime("%Y_%m_%d")
+        output_file = f"eks_analysis_output_{current_date}.csv"
+    else:
+        output_file = "eks_analysis_output.csv"
+
+    Logger.header(header)
+
+    if not os.path.exists(csv_file):
+        Logger.error(f"CSV file '{csv_file}' not found in current directory")
+        Logger.error(f"Current directory: {os.getcwd()}", indent=1)
+        return 1
+
+    Logger.info(f"Reading accounts from {csv_file}")
+    csv_handler = CSVHandler()
+    accounts = csv_handler.read_accounts(csv_file)
+
+    if not accounts:
+        Logger.error("No valid accounts to process")
+        Logger.error("Check CSV format: account_id,role_name,region", indent=1)
+        return 1
+
+    Logger.success(f"Found {len(accounts)} account-region combination(s) to process")
+
+    from modules.aws_session import AWSSession
+    from modules.cluster_analyzer import ClusterAnalyzer
+    from modules.s3_handler import S3Handler
+
+    role_assumer = None
+    if auth == 'sso':
+        from modules.sso_auth import SSOAuthenticator
+
+        accounts_data = {acc["account_id"]: acc["role_name"] for acc in accounts}
+
+        # A dedicated upload profile must exist before authentication
+        if s3_upload == 's3-account' and args.s3_account not in accounts_data:
+            accounts_data[args.s3_account] = "PatchingAccess"
+            Logger.info(f"Adding S3 account {args.s3_account} with PatchingAccess role to SSO profiles")
+
+        Logger.section("SSO AUTHENTICATION SETUP")
+        Logger.info(f"Setting up SSO profiles for {len(accounts_data)} account(s)")
+        SSOAuthenticator.setup_profiles(accounts_data)
+
+        first_account = next(iter(accounts_data))
+        if not SSOAuthenticator.authenticate(first_account):
+            Logger.error("SSO authentication failed")
+            return 1
+    else:
+        from modules.role_assumption import RoleAssumption
+
+        Logger.section("INITIALIZING ROLE ASSUMPTION")
+        role_assumer = RoleAssumption()
+
+        base_identity = role_assumer.get_base_caller_identity()
+        if not base_identity:
+            Logger.error("Failed to get base caller identity")
+            Logger.error("Ensure GitHub Actions has assumed the base role correctly", indent=1)
+            return 1
+
+        Logger.info(f"Base role identity:")
+        Logger.info(f"Account: {base_identity.get('Account', 'N/A')}", indent=1)
+        Logger.info(f"Arn: {base_identity.get('Arn', 'N/A')}", indent=1)
+        Logger.success("Base role verification successful")
+
+    def _process_account(account_info):
+        """Analyze one account-region pair; returns its rows (empty on failure)."""
+        account_id = account_info["account_id"]
+        region = account_info["region"]
+
+        Logger.section(f"PROCESSING: Account {account_id} | Region {region}")
+
+        try:
+            if auth == 'sso':
+                aws_session = AWSSession(region, profile_name=account_id)
+                analysis_session = aws_session.session
+            else:
+                assumed_session = role_assumer.assume_role(account_id, account_info["role_name"], region)
+                if not assumed_session:
+                    Logger.error(f"Failed to assume role in account {account_id}, skipping")
+                    return []
+                aws_session = AWSSession(assumed_session, region)
+                analysis_session = assumed_session
+
+            aws_session.print_identity(account_id)
+            account_name = aws_session.get_account_name()
+            Logger.info(f"Account Name: {account_name}")
+
+            analyzer = ClusterAnalyzer(analysis_session, region)
+            results = analyzer.analyze_clusters(account_id, account_name)
+
+            if results:
+                Logger.success(f"Collected {len(results)} record(s) from {account_id} ({region})")
+            else:
+                Logger.warning(f"No data collected for {account_id} ({region})")
+            return results
+
+        except Exception as e:
+            error_msg = str(e)
+            Logger.error(f"Failed to process {account_id} in {region}: {error_msg}")
+            if "NoCredentialProviders" in error_msg:
+                Logger.error("SSO credentials may have expired. Try re-authenticating", indent=1)
+            elif "InvalidClientTokenId" in error_msg:
+                Logger.error("Invalid credentials. Check profile or OIDC configuration", indent=1)
+            elif "AccessDenied" in error_msg:
+                Logger.error(f"Insufficient permissions for account {account_id}", indent=1)
+            return []
+
+    all_results = []
+
+    # Each account-region pair is an independent set of AWS calls, so fan
+    # them out; wall time drops to roughly the slowest account
+    with ThreadPoolExecutor(max_workers=min(16, len(accounts))) as executor:
+        futures = {executor.submit(_process_account, a): a for a in accounts}
+        for future in as_completed(futures):
+            all_results.extend(future.result())
+
+    Logger.section("FINALIZING RESULTS")
+    csv_handler.write_cluster_data(output_file, all_results)
+
+    Logger.blank()
+    Logger.success("Analysis complete")
+    Logger.info(f"Processed {len(accounts)} account-region combination(s)")
+    Logger.info(f"Total records: {len(all_results)}")
+    Logger.info(f"Local output file: {output_file}")
+
+    if args.skip_s3:
+        Logger.info("Skipping S3 upload (--skip-s3 flag set)")
+    else:
+        try:
+            Logger.section("UPLOADING TO S3")
+            if s3_upload == 'role':
+                s3_session = role_assumer.assume_s3_upload_role()
+                if not s3_session:
+                    Logger.error("Failed to assume S3 upload role")
+                    Logger.warning("Local file saved successfully despite S3 upload failure")
+                    s3_session = None
+            elif s3_upload == 's3-account':
+                Logger.info(f"Assuming role in account {args.s3_account}")
+                s3_session = AWSSession("us-east-1", profile_name=args.s3_account).session
+            else:
+                # The per-profile session cache makes this a cheap reuse of
+                # the first account's session, not a fresh credential chain
+                s3_session = AWSSession(accounts[0]["region"], profile_name=accounts[0]["account_id"]).session
+
+            if s3_session:
+                s3_handler = S3Handler(s3_session)
+                if s3_upload == 'first-account':
+                    # These variants' S3Handler timestamps the key itself
+                    success = s3_handler.upload_file(output_file, args.s3_bucket, args.s3_prefix)
+                else:
+                    success = s3_handler.upload_file(
+                        local_file=output_file,
+                        bucket=args.s3_bucket,
+                        prefix=args.s3_prefix,
+                        preserve_filename=True
+                    )
+                if not success:
+                    Logger.warning("S3 upload failed, but local file is available")
+        except Exception as e:
+            Logger.error(f"S3 upload error: {e}")
+            Logger.warning("Local file saved successfully despite S3 upload failure")
+
+    if auth == 'sso':
+        from modules.sso_auth import SSOAuthenticator
+
+        Logger.section("CLEANUP")
+        Logger.info("Cleaning up SSO cache")
+        SSOAuthenticator.cleanup_cache()
+
+    Logger.separator()
+    Logger.blank()
+    return 0
+
+
+def main(**kwargs):
+    """run() with the interrupt/crash handling the variants shared."""
+    try:
+        return run(**kwargs)
+    except KeyboardInterrupt:
+        Logger.blank()
+        Logger.warning("Interrupted by user")
+        if kwargs.get('auth', 'sso') == 'sso':
+            from modules.sso_auth import SSOAuthenticator
+            SSOAuthenticator.cleanup_cache()
+        return 130
+    except Exception as e:
+        Logger.blank()
+        Logger.critical(f"Unexpected error: {e}")
+        return 1
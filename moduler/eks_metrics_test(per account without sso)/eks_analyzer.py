@@ -4,8 +4,6 @@ import os
 import sys
 import argparse
 from typing import List
-from modules.aws_session import AWSSession
-from modules.cluster_analyzer import ClusterAnalyzer
 from modules.csv_handler import CSVHandler
 from modules.logger import Logger
 
@@ -53,6 +51,11 @@ def main():
     if not regions:
         return 1
     
+    # Deferred: these pull in boto3, which --help and the missing-regions
+    # exit above never need
+    from modules.aws_session import AWSSession
+    from modules.cluster_analyzer import ClusterAnalyzer
+    
     # Verify AWS credentials
     Logger.section("VERIFYING AWS CREDENTIALS")
     try:
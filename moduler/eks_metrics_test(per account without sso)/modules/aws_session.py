@@ -1,27 +1,55 @@
 import boto3
+from threading import Lock
 from typing import Dict, Optional
 from .logger import Logger
 
 
 class AWSSession:
     
+    # STS identity per profile, shared across instances: the same account
+    # scanned in several regions answers get_caller_identity once
+    _IDENTITY_CACHE: Dict[str, Dict[str, str]] = {}
+    _IDENTITY_LOCK = Lock()
+    
+    # boto3 sessions and STS clients per (profile, region): rebuilding a
+    # Session re-parses ~/.aws/config and client construction walks the
+    # endpoint data, so both are memoized for the lifetime of the run
+    _SESSION_CACHE: Dict[tuple, object] = {}
+    _CLIENT_CACHE: Dict[tuple, object] = {}
+    _CACHE_LOCK = Lock()
+    
     def __init__(self, region: str):
         self.region = region
-        self._identity_cache = None
         self._account_name_cache = None
         try:
-            self.session = boto3.Session(region_name=region)
+            key = ("", region)
+            with self._CACHE_LOCK:
+                session = self._SESSION_CACHE.get(key)
+                if session is None:
+                    session = boto3.Session(region_name=region)
+                    self._SESSION_CACHE[key] = session
+            self.session = session
         except Exception as e:
             Logger.error(f"Failed to create AWS session: {e}")
             raise
     
     def get_caller_identity(self) -> Dict[str, str]:
-        if self._identity_cache:
-            return self._identity_cache
+        key = getattr(self, "profile_name", None) or "__default__"
+        with self._IDENTITY_LOCK:
+            cached = self._IDENTITY_CACHE.get(key)
+        if cached:
+            return cached
         try:
-            sts = self.session.client("sts", region_name=self.region)
-            self._identity_cache = sts.get_caller_identity()
-            return self._identity_cache
+            client_key = (getattr(self, "profile_name", None) or "", self.region, "sts")
+            with self._CACHE_LOCK:
+                sts = self._CLIENT_CACHE.get(client_key)
+                if sts is None:
+                    sts = self.session.client("sts", region_name=self.region)
+                    self._CLIENT_CACHE[client_key] = sts
+            identity = sts.get_caller_identity()
+            with self._IDENTITY_LOCK:
+                self._IDENTITY_CACHE[key] = identity
+            return identity
         except Exception as e:
             Logger.error(f"Failed to get caller identity: {e}")
             Logger.error("This usually means authentication failed or credentials expired", indent=1)
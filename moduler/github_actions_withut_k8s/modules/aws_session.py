@@ -1,3 +1,5 @@
+import functools
+from types import MappingProxyType
 import boto3
 from typing import Dict, Optional
 from .logger import Logger
@@ -113,6 +115,12 @@ class AWSSession:
         "780573890979": "mmfhir-sbx",
     }
     
+    # Int keys hash trivially in CPython (no SipHash pass over the 12-digit
+    # string) and the proxy freezes the public map against accidental writes
+    _ACCOUNT_NAME_MAP_INT = {int(k): v for k, v in ACCOUNT_NAME_MAP.items()}
+    ACCOUNT_NAME_MAP = MappingProxyType(ACCOUNT_NAME_MAP)
+    
+    
     def __init__(self, session, region: str):
         """
         Initialize AWSSession with an existing boto3 session.
@@ -124,7 +132,6 @@ class AWSSession:
         self.session = session
         self.region = region
         self._identity_cache = None
-        self._account_name_cache = None
         
         try:
             self.sts_client = session.client("sts", region_name=region)
@@ -142,16 +149,20 @@ class AWSSession:
             Logger.error(f"Failed to get caller identity: {e}")
             return {}
     
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _lookup_name(account_id: str) -> str:
+        # Look up account name from static map, default to account ID if not
+        # found; lru_cache shares the resolution across all instances
+        try:
+            key = int(account_id)
+        except (TypeError, ValueError):
+            return account_id
+        return AWSSession._ACCOUNT_NAME_MAP_INT.get(key, account_id)
+    
     def get_account_name(self) -> str:
-        if self._account_name_cache:
-            return self._account_name_cache
-        
         identity = self.get_caller_identity()
-        account_id = identity.get("Account", "Unknown")
-        
-        # Look up account name from static map, default to account ID if not found
-        self._account_name_cache = self.ACCOUNT_NAME_MAP.get(account_id, account_id)
-        return self._account_name_cache
+        return self._lookup_name(identity.get("Account", "Unknown"))
     
     def print_identity(self, account_id: str):
         try:
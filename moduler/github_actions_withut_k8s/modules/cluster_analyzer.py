@@ -120,7 +120,7 @@ class ClusterAnalyzer:
                 "NodeUptime": node.get("NodeUptime", "N/A"),
                 "Latest_AMI_ID": latest_ami_id,
                 "New_AMI_Publication_Date": new_ami_publication_date,
-                "PatchPendingStatus": self.node_ops.get_patch_status(node.get("AMI_Age", "N/A")),
+                "PatchPendingStatus": self.node_ops.get_patch_status(node.get("AMI_Age_Days")),
                 "NodeReadinessStatus": readiness_map.get(instance_id, "Unknown"),
                 "Cluster_Compliance": compliance
             }
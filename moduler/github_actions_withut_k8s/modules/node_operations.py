@@ -1,9 +1,17 @@
 from typing import List, Dict, Tuple
 from datetime import datetime, timezone
 from botocore.exceptions import ClientError
+from threading import Lock
 from .logger import Logger
 
 
+# AMI metadata is immutable and the EKS-optimized images are shared
+# region-wide across accounts, so each image is described at most once
+# per process regardless of how many clusters or accounts reference it
+_AMI_CACHE: Dict[Tuple[str, str], Dict] = {}
+_AMI_CACHE_LOCK = Lock()
+
+
 class NodeOperations:
     
     PATCH_THRESHOLD_DAYS = 70
@@ -59,26 +67,47 @@ class NodeOperations:
     
     def _enrich_with_ami_data(self, nodes: List[Dict], ami_ids: List[str]):
         ami_data = self._get_ami_info(ami_ids)
+        now = datetime.now(timezone.utc)
         for node in nodes:
             if node["Current_AMI_ID"] in ami_data:
                 ami_info = ami_data[node["Current_AMI_ID"]]
-                node["AMI_Age"] = self._calculate_ami_age(ami_info.get("CreationDate"))
-                node["Current_AMI_Publication_Date"] = self._format_publication_date(ami_info.get("CreationDate"))
+                creation_date = ami_info.get("CreationDateParsed")
+                age_days = (now - creation_date).days if creation_date else None
+                node["AMI_Age_Days"] = age_days
+                node["AMI_Age"] = self._calculate_ami_age(age_days)
+                node["Current_AMI_Publication_Date"] = self._format_publication_date(creation_date)
                 node["OS_Version"] = self._parse_os_version(ami_info.get("Description", ""))
             else:
+                node["AMI_Age_Days"] = None
                 node["AMI_Age"] = "N/A"
                 node["Current_AMI_Publication_Date"] = "N/A"
                 node["OS_Version"] = "N/A"
     
     def _get_ami_info(self, ami_ids: List[str]) -> Dict[str, Dict]:
-        try:
-            response = self.ec2_client.describe_images(ImageIds=ami_ids)
-            return {img["ImageId"]: {
-                "CreationDate": img.get("CreationDate"),
-                "Description": img.get("Description", "")
-            } for img in response.get("Images", [])}
-        except ClientError:
-            return {}
+        with _AMI_CACHE_LOCK:
+            missing = [a for a in ami_ids if (self.region, a) not in _AMI_CACHE]
+        if missing:
+            try:
+                response = self.ec2_client.describe_images(ImageIds=missing)
+            except ClientError:
+                response = {}
+            with _AMI_CACHE_LOCK:
+                for img in response.get("Images", []):
+                    raw = img.get("CreationDate")
+                    try:
+                        # Parse once at fetch time; every consumer of this
+                        # entry gets the datetime instead of re-parsing
+                        parsed = datetime.fromisoformat(raw.replace('Z', '+00:00')) if raw else None
+                    except ValueError:
+                        parsed = None
+                    _AMI_CACHE[(self.region, img["ImageId"])] = {
+                        "CreationDate": raw,
+                        "CreationDateParsed": parsed,
+                        "Description": img.get("Description", "")
+                    }
+        with _AMI_CACHE_LOCK:
+            return {a: _AMI_CACHE[(self.region, a)]
+                    for a in ami_ids if (self.region, a) in _AMI_CACHE}
     
     @staticmethod
     def _calculate_uptime(launch_time) -> str:
@@ -93,25 +122,16 @@ class NodeOperations:
             return "N/A"
     
     @staticmethod
-    def _calculate_ami_age(creation_date_str: str) -> str:
-        if not creation_date_str:
-            return "N/A"
-        try:
-            creation_date = datetime.fromisoformat(creation_date_str.replace('Z', '+00:00'))
-            delta = datetime.now(timezone.utc) - creation_date
-            return str(delta.days)
-        except Exception:
+    def _calculate_ami_age(age_days) -> str:
+        if age_days is None:
             return "N/A"
+        return str(age_days)
     
     @staticmethod
-    def _format_publication_date(creation_date_str: str) -> str:
-        if not creation_date_str:
-            return "N/A"
-        try:
-            creation_date = datetime.fromisoformat(creation_date_str.replace('Z', '+00:00'))
-            return creation_date.strftime("%d/%m/%y")
-        except Exception:
+    def _format_publication_date(creation_date) -> str:
+        if not creation_date:
             return "N/A"
+        return creation_date.strftime("%d/%m/%y")
     
     @staticmethod
     def _parse_os_version(description: str) -> str:
@@ -130,11 +150,9 @@ class NodeOperations:
         return "Unknown"
     
     @staticmethod
-    def get_patch_status(ami_age_str: str) -> str:
-        if ami_age_str and ami_age_str != "N/A":
-            try:
-                days = int(ami_age_str.split()[0])
-                return "1" if days >= NodeOperations.PATCH_THRESHOLD_DAYS else "0"
-            except (ValueError, IndexError):
-                pass
+    def get_patch_status(ami_age_days) -> str:
+        # Age arrives pre-computed as an int (or None when unknown), so
+        # there is no string round-trip before the threshold comparison
+        if ami_age_days is not None:
+            return "1" if ami_age_days >= NodeOperations.PATCH_THRESHOLD_DAYS else "0"
         return "0"
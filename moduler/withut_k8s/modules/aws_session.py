@@ -1,4 +1,7 @@
+import functools
+from types import MappingProxyType
 import boto3
+from threading import Lock
 from typing import Dict, Optional
 from .logger import Logger
 
@@ -113,42 +116,78 @@ class AWSSession:
         "780573890979": "mmfhir-sbx",
     }
     
+    # Int keys hash trivially in CPython (no SipHash pass over the 12-digit
+    # string) and the proxy freezes the public map against accidental writes
+    _ACCOUNT_NAME_MAP_INT = {int(k): v for k, v in ACCOUNT_NAME_MAP.items()}
+    ACCOUNT_NAME_MAP = MappingProxyType(ACCOUNT_NAME_MAP)
+    
+    
+    # STS identity per profile, shared across instances: the same account
+    # scanned in several regions answers get_caller_identity once
+    _IDENTITY_CACHE: Dict[str, Dict[str, str]] = {}
+    _IDENTITY_LOCK = Lock()
+    
+    # boto3 sessions and STS clients per (profile, region): rebuilding a
+    # Session re-parses ~/.aws/config and client construction walks the
+    # endpoint data, so both are memoized for the lifetime of the run
+    _SESSION_CACHE: Dict[tuple, object] = {}
+    _CLIENT_CACHE: Dict[tuple, object] = {}
+    _CACHE_LOCK = Lock()
+    
     def __init__(self, region: str, profile_name: Optional[str] = None):
         self.region = region
         self.profile_name = profile_name
-        self._identity_cache = None
-        self._account_name_cache = None
         try:
-            if profile_name:
-                self.session = boto3.Session(profile_name=profile_name, region_name=region)
-            else:
-                self.session = boto3.Session(region_name=region)
+            key = (profile_name or "", region)
+            with self._CACHE_LOCK:
+                session = self._SESSION_CACHE.get(key)
+                if session is None:
+                    if profile_name:
+                        session = boto3.Session(profile_name=profile_name, region_name=region)
+                    else:
+                        session = boto3.Session(region_name=region)
+                    self._SESSION_CACHE[key] = session
+            self.session = session
         except Exception as e:
             Logger.error(f"Failed to create AWS session: {e}")
             raise
     
     def get_caller_identity(self) -> Dict[str, str]:
-        if self._identity_cache:
-            return self._identity_cache
+        key = getattr(self, "profile_name", None) or "__default__"
+        with self._IDENTITY_LOCK:
+            cached = self._IDENTITY_CACHE.get(key)
+        if cached:
+            return cached
         try:
-            sts = self.session.client("sts", region_name=self.region)
-            self._identity_cache = sts.get_caller_identity()
-            return self._identity_cache
+            client_key = (getattr(self, "profile_name", None) or "", self.region, "sts")
+            with self._CACHE_LOCK:
+                sts = self._CLIENT_CACHE.get(client_key)
+                if sts is None:
+                    sts = self.session.client("sts", region_name=self.region)
+                    self._CLIENT_CACHE[client_key] = sts
+            identity = sts.get_caller_identity()
+            with self._IDENTITY_LOCK:
+                self._IDENTITY_CACHE[key] = identity
+            return identity
         except Exception as e:
             Logger.error(f"Failed to get caller identity: {e}")
             Logger.error("This usually means authentication failed or credentials expired", indent=1)
             raise
     
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _lookup_name(account_id: str) -> str:
+        # Look up account name from static map, default to account ID if not
+        # found; lru_cache shares the resolution across all instances
+        try:
+            key = int(account_id)
+        except (TypeError, ValueError):
+            return account_id
+        return AWSSession._ACCOUNT_NAME_MAP_INT.get(key, account_id)
+    
     def get_account_name(self) -> str:
-        if self._account_name_cache:
-            return self._account_name_cache
-        
         identity = self.get_caller_identity()
-        account_id = identity["Account"]
-        
-        # Look up account name from static map, default to account ID if not found
-        self._account_name_cache = self.ACCOUNT_NAME_MAP.get(account_id, account_id)
-        return self._account_name_cache
+        return self._lookup_name(identity["Account"])
     
     def print_identity(self, account_id: str):
         try: